@@ -8,6 +8,8 @@ from .middleware import (
     check_feature_access,
     log_usage,
     get_user_from_request,
+    start_usage_writer,
+    stop_usage_writer,
 )
 from .late_oauth import (
     get_authorization_url,
@@ -28,6 +30,8 @@ __all__ = [
     "check_feature_access",
     "log_usage",
     "get_user_from_request",
+    "start_usage_writer",
+    "stop_usage_writer",
     "get_authorization_url",
     "exchange_code_for_token",
     "save_tokens",
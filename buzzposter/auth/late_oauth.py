@@ -3,6 +3,7 @@ Late.dev OAuth flow implementation
 """
 import os
 import httpx
+from typing import Any, Dict, Tuple
 from urllib.parse import urlencode
 from fastapi import HTTPException
 from sqlalchemy import select
@@ -19,6 +20,19 @@ BASE_URL = os.getenv("BASE_URL", "http://localhost:8000")
 LATE_AUTHORIZE_URL = "https://app.getlate.dev/oauth/authorize"
 LATE_TOKEN_URL = "https://getlate.dev/api/v1/oauth/token"
 
+# (user_id, endpoint, sorted params) -> (expires_at, response) for successful
+# Late.dev GETs made by the social tools. Lives here so token/account
+# changes in this module can invalidate it without an import cycle
+LATE_GET_CACHE_TTL = 30.0
+LATE_GET_CACHE_SIZE = 10_000
+LATE_GET_CACHE: Dict[Tuple[int, str, tuple], Tuple[float, Dict[str, Any]]] = {}
+
+
+def invalidate_late_cache(user_id: int, endpoint_prefix: str = "") -> None:
+    """Drop a user's cached Late.dev responses whose endpoint starts with endpoint_prefix"""
+    for key in [k for k in LATE_GET_CACHE if k[0] == user_id and k[1].startswith(endpoint_prefix)]:
+        del LATE_GET_CACHE[key]
+
 
 def get_authorization_url(api_key: str) -> str:
     """
@@ -102,6 +116,10 @@ async def save_tokens(db: AsyncSession, api_key: str, access_token: str, refresh
     user.late_refresh_token = refresh_token
     await db.commit()
 
+    # New tokens may belong to a different Late.dev account or changed
+    # social accounts, so none of the user's cached responses still apply
+    invalidate_late_cache(user.id)
+
 
 async def get_connected_accounts(access_token: str) -> dict:
     """
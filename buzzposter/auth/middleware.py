@@ -1,12 +1,44 @@
 """
 Authentication middleware for API key validation and rate limiting
 """
+import asyncio
+import logging
 from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
 from fastapi import HTTPException, Request
-from sqlalchemy import select, func
+from sqlalchemy import select, func, insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from ..db.connection import AsyncSessionLocal
 from ..db.models import User, UsageLog
 
+logger = logging.getLogger(__name__)
+
+# Usage rows are queued and written in batches of up to USAGE_FLUSH_BATCH,
+# at most USAGE_FLUSH_INTERVAL seconds after the first row of a batch
+USAGE_FLUSH_BATCH = 500
+USAGE_FLUSH_INTERVAL = 2.0
+
+# Queued rows beyond this are written synchronously by log_usage instead
+USAGE_QUEUE_MAX = 10_000
+
+# Attempts at writing a batch that fails transiently before it is dropped,
+# with backoff between attempts (doubling up to the max)
+USAGE_WRITE_ATTEMPTS = 4
+USAGE_RETRY_DELAY = 1.0
+USAGE_RETRY_MAX_DELAY = 30.0
+
+_usage_queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=USAGE_QUEUE_MAX)
+_usage_writer: Optional[asyncio.Task] = None
+# Uncommitted rows the writer has taken off the queue; rows leave this list
+# as soon as they are committed (or dropped), so shutdown flushes only the rest
+_usage_batch: List[Dict[str, Any]] = []
+# The batch write in progress, shielded from writer cancellation
+_usage_flush: Optional[asyncio.Future] = None
+# user_id -> rows queued or in the current batch but not yet committed;
+# check_rate_limit adds these to the database count
+_usage_pending: Dict[int, int] = {}
+
 
 class UserContext:
     """User context passed to tool handlers"""
@@ -16,6 +48,12 @@ class UserContext:
         self.tier = user.tier
         self.late_token = user.late_oauth_token
         self.late_refresh_token = user.late_refresh_token
+        # Today's usage count, memoized for the lifetime of this request
+        self.usage_day = None
+        self.usage_today = None
+        # Per-request memoized lookups (profile, feeds); tools that change
+        # the underlying rows pop the affected keys
+        self.cache = {}
 
 
 async def validate_api_key(api_key: str, db: AsyncSession) -> UserContext:
@@ -61,15 +99,19 @@ async def check_rate_limit(user_context: UserContext, tool_name: str) -> None:
     if limit is None:
         return
 
-    # Count usage today
+    # Count usage today (once per request; log_usage keeps it current)
     today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
 
-    result = await user_context.db.execute(
-        select(func.count(UsageLog.id))
-        .where(UsageLog.user_id == user_context.user.id)
-        .where(UsageLog.timestamp >= today_start)
-    )
-    usage_count = result.scalar()
+    if user_context.usage_day != today_start:
+        result = await user_context.db.execute(
+            select(func.count(UsageLog.id))
+            .where(UsageLog.user_id == user_context.user.id)
+            .where(UsageLog.timestamp >= today_start)
+        )
+        user_context.usage_today = result.scalar() + _usage_pending.get(user_context.user.id, 0)
+        user_context.usage_day = today_start
+
+    usage_count = user_context.usage_today
 
     if usage_count >= limit:
         upgrade_message = (
@@ -107,28 +149,139 @@ async def check_feature_access(user_context: UserContext, feature: str) -> None:
 
 
 async def log_usage(user_context: UserContext, tool_name: str) -> None:
-    """Log tool usage for the user"""
-    usage_log = UsageLog(
-        user_id=user_context.user.id,
-        tool_name=tool_name,
-        timestamp=datetime.utcnow()
-    )
-    user_context.db.add(usage_log)
-    await user_context.db.commit()
+    """
+    Log tool usage for the user.
+    Queued for the background writer when it is running; written directly
+    otherwise (e.g. outside the app lifespan) or when the queue is full.
+    """
+    row = {
+        "user_id": user_context.user.id,
+        "tool_name": tool_name,
+        "timestamp": datetime.utcnow(),
+    }
+    queued = False
+    if _usage_writer is not None and not _usage_writer.done():
+        try:
+            _usage_queue.put_nowait(row)
+            queued = True
+        except asyncio.QueueFull:
+            pass
+
+    if queued:
+        _usage_pending[row["user_id"]] = _usage_pending.get(row["user_id"], 0) + 1
+    else:
+        user_context.db.add(UsageLog(**row))
+        await user_context.db.commit()
 
+    if user_context.usage_today is not None:
+        user_context.usage_today += 1
 
-async def get_user_from_request(request: Request, db: AsyncSession) -> UserContext:
+
+async def _write_usage(rows: List[Dict[str, Any]]) -> None:
+    """Insert a batch of usage rows in one statement and one commit"""
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(UsageLog), rows)
+        await db.commit()
+
+
+def _release_pending(rows: List[Dict[str, Any]]) -> None:
+    """Stop counting rows as pending once they are committed"""
+    for row in rows:
+        user_id = row["user_id"]
+        remaining = _usage_pending.get(user_id, 0) - 1
+        if remaining > 0:
+            _usage_pending[user_id] = remaining
+        else:
+            _usage_pending.pop(user_id, None)
+
+
+async def _flush_usage(rows: List[Dict[str, Any]], attempts: int) -> None:
     """
-    Extract and validate API key from request headers
-    Used by MCP endpoints
+    Write rows, retrying transient failures up to attempts times before
+    dropping them. On an IntegrityError the rows are written one at a time
+    so a single bad row (e.g. for a deleted user) is the only one lost.
+    rows is emptied as rows are committed or dropped; their pending counts
+    are released either way.
     """
-    auth_header = request.headers.get("Authorization")
+    batch = list(rows)
+    try:
+        delay = USAGE_RETRY_DELAY
+        for attempt in range(1, attempts + 1):
+            try:
+                await _write_usage(rows)
+                rows.clear()
+                return
+            except IntegrityError:
+                break
+            except Exception as e:
+                if attempt == attempts:
+                    logger.error("Dropping %d usage log rows after %d attempts: %s", len(rows), attempts, e)
+                    return
+                logger.warning("Failed to write %d usage log rows, retrying in %.0fs: %s", len(rows), delay, e)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, USAGE_RETRY_MAX_DELAY)
+
+        for row in list(rows):
+            try:
+                await _write_usage([row])
+            except Exception as e:
+                logger.error("Dropping usage log row %r: %s", row, e)
+            rows.remove(row)
+    finally:
+        rows.clear()
+        _release_pending(batch)
+
+
+async def _run_usage_writer() -> None:
+    """Drain the usage queue forever, one batch per flush window"""
+    global _usage_flush
+    loop = asyncio.get_running_loop()
+    # Rows are collected straight into _usage_batch so a shutdown mid-batch
+    # can still flush them
+    rows = _usage_batch
+    while True:
+        rows.append(await _usage_queue.get())
+        deadline = loop.time() + USAGE_FLUSH_INTERVAL
+        while len(rows) < USAGE_FLUSH_BATCH:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                rows.append(await asyncio.wait_for(_usage_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        # Shielded so cancelling the writer never interrupts a commit;
+        # stop_usage_writer waits for it instead of re-inserting its rows
+        _usage_flush = asyncio.ensure_future(_flush_usage(rows, USAGE_WRITE_ATTEMPTS))
+        await asyncio.shield(_usage_flush)
+
+
+def start_usage_writer() -> None:
+    """Start the background usage writer (called on application startup)"""
+    global _usage_writer
+    if _usage_writer is None or _usage_writer.done():
+        _usage_writer = asyncio.create_task(_run_usage_writer())
+
 
-    if not auth_header:
-        raise HTTPException(status_code=401, detail="Missing Authorization header")
+async def stop_usage_writer() -> None:
+    """Stop the usage writer and flush queued rows (called on application shutdown)"""
+    global _usage_writer, _usage_flush
+    if _usage_writer is not None:
+        _usage_writer.cancel()
+        try:
+            await _usage_writer
+        except asyncio.CancelledError:
+            pass
+        _usage_writer = None
 
-    if not auth_header.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Invalid Authorization header format")
+    # Let an in-flight batch write finish; it empties _usage_batch as it goes
+    if _usage_flush is not None:
+        await asyncio.gather(_usage_flush, return_exceptions=True)
+        _usage_flush = None
 
-    api_key = auth_header.replace("Bearer ", "")
-    return await validate_api_key(api_key, db)
+    # Rows collected for a batch that never started, plus everything queued
+    while not _usage_queue.empty():
+        _usage_batch.append(_usage_queue.get_nowait())
+    if _usage_batch:
+        await _flush_usage(_usage_batch, attempts=1)
@@ -2,6 +2,7 @@
 Database connection and session management
 """
 import os
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.pool import NullPool
 from .models import Base
@@ -39,7 +40,27 @@ async def get_db():
             await session.close()
 
 
+# Idempotent upgrades for tables that already exist (create_all only creates
+# missing tables, never indexes on existing ones). Duplicate custom feeds left
+# by the old check-then-insert path are collapsed to the oldest row first so
+# the unique index can be built.
+_SCHEMA_UPGRADES = (
+    """
+    DELETE FROM user_feeds a
+    USING user_feeds b
+    WHERE a.user_id = b.user_id
+      AND a.feed_url = b.feed_url
+      AND a.id > b.id
+    """,
+    "CREATE UNIQUE INDEX IF NOT EXISTS uq_user_feeds_user_url ON user_feeds (user_id, feed_url)",
+    # Newest-first media listing / keyset pagination
+    "CREATE INDEX IF NOT EXISTS ix_media_user_created ON media (user_id, created_at DESC, id DESC)",
+)
+
+
 async def init_db():
-    """Initialize database tables"""
+    """Initialize database tables and apply schema upgrades"""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        for statement in _SCHEMA_UPGRADES:
+            await conn.execute(text(statement))
@@ -2,7 +2,7 @@
 Database models for BuzzPoster MCP Server
 """
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, JSON, Index
+from sqlalchemy import Column, String, Integer, BigInteger, DateTime, Text, ForeignKey, JSON, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -62,6 +62,8 @@ class UserFeed(Base):
     # Index for efficient user feed queries
     __table_args__ = (
         Index('idx_user_feeds', 'user_id'),
+        # One row per feed URL per user (add_feed inserts ON CONFLICT DO NOTHING)
+        Index('uq_user_feeds_user_url', 'user_id', 'feed_url', unique=True),
     )
 
 
@@ -97,9 +99,20 @@ class Media(Base):
     __table_args__ = (
         Index('idx_user_media', 'user_id'),
         Index('idx_r2_key', 'r2_key'),
+        # Newest-first listing and keyset pagination per user
+        Index('ix_media_user_created', 'user_id', created_at.desc(), id.desc()),
     )
 
 
+class UserStorageStats(Base):
+    __tablename__ = "user_storage_stats"
+
+    # Running media totals, updated in the same transaction as media inserts/deletes
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    total_bytes = Column(BigInteger, default=0, nullable=False)
+    file_count = Column(Integer, default=0, nullable=False)
+
+
 class UserIntegration(Base):
     __tablename__ = "user_integrations"
 
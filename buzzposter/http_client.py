@@ -0,0 +1,40 @@
+"""
+Shared HTTP client configuration for outbound API and feed requests
+"""
+from typing import Optional
+
+import httpx
+
+
+# Separate connect/read/write/pool budgets so an unreachable host fails fast
+# instead of holding the caller for the full read timeout
+DEFAULT_TIMEOUT = httpx.Timeout(connect=5.0, read=20.0, write=5.0, pool=5.0)
+
+# Pool sizing for the shared client
+DEFAULT_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide pooled HTTP client, creating it on first use.
+    Reusing one client keeps connections (and TLS sessions) alive between
+    tool calls instead of handshaking on every request.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT,
+            limits=DEFAULT_LIMITS,
+            http2=True,
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (called on application shutdown)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -3,6 +3,7 @@ BuzzPoster Remote MCP Server
 Main FastAPI application with SSE transport and REST endpoints
 """
 import os
+import json
 import secrets
 from typing import Any
 from datetime import datetime
@@ -23,6 +24,8 @@ from .db import (
 )
 from .auth import (
     get_user_from_request,
+    start_usage_writer,
+    stop_usage_writer,
     validate_api_key,
     get_authorization_url,
     exchange_code_for_token,
@@ -32,6 +35,8 @@ from .auth import (
     handle_checkout_completed,
     verify_webhook_signature,
 )
+from .http_client import close_http_client
+from .tools.feeds import shutdown_parse_pool
 from .tools import (
     buzzposter_get_feed,
     buzzposter_get_topic,
@@ -72,10 +77,17 @@ from .tools import (
 # Initialize database on startup
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize database on startup"""
+    """Start the database and usage writer; on shutdown flush usage and release pooled connections"""
     await init_db()
     print("Database initialized")
+    start_usage_writer()
     yield
+    try:
+        await stop_usage_writer()
+    finally:
+        # Release pooled connections and workers even if the flush fails
+        await close_http_client()
+        shutdown_parse_pool()
 
 
 # Create FastAPI app
@@ -297,6 +309,11 @@ async def list_tools() -> list[Tool]:
                     "customize_per_platform": {
                         "type": "object",
                         "description": "Optional platform-specific content overrides"
+                    },
+                    "parallel": {
+                        "type": "boolean",
+                        "description": "Post to each platform concurrently instead of one cross-post request",
+                        "default": False
                     }
                 },
                 "required": ["platforms", "content"]
@@ -395,10 +412,20 @@ async def list_tools() -> list[Tool]:
         ),
         Tool(
             name="buzzposter_list_media",
-            description="List all uploaded media files with URLs, sizes, and storage usage. Requires Pro or Business tier.",
+            description="List uploaded media files (newest first) with URLs, sizes, and storage usage. Paginated: pass next_cursor back as cursor for the next page. Requires Pro or Business tier.",
             inputSchema={
                 "type": "object",
-                "properties": {}
+                "properties": {
+                    "limit": {
+                        "type": "integer",
+                        "description": "Number of files to return (default 50, max 200)",
+                        "default": 50
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": "next_cursor value from the previous page"
+                    }
+                }
             }
         ),
         Tool(
@@ -637,6 +664,44 @@ async def list_tools() -> list[Tool]:
     ]
 
 
+# Tool name -> handler, built once at import rather than per call
+TOOL_HANDLERS = {
+    "buzzposter_get_feed": lambda ctx, args: buzzposter_get_feed(ctx, **args),
+    "buzzposter_get_topic": lambda ctx, args: buzzposter_get_topic(ctx, **args),
+    "buzzposter_search_news": lambda ctx, args: buzzposter_search_news(ctx, **args),
+    "buzzposter_add_feed": lambda ctx, args: buzzposter_add_feed(ctx, **args),
+    "buzzposter_remove_feed": lambda ctx, args: buzzposter_remove_feed(ctx, **args),
+    "buzzposter_list_feeds": lambda ctx, args: buzzposter_list_feeds(ctx),
+    "buzzposter_set_profile": lambda ctx, args: buzzposter_set_profile(ctx, **args),
+    "buzzposter_my_feed": lambda ctx, args: buzzposter_my_feed(ctx),
+    "buzzposter_list_social_accounts": lambda ctx, args: buzzposter_list_social_accounts(ctx),
+    "buzzposter_post": lambda ctx, args: buzzposter_post(ctx, **args),
+    "buzzposter_cross_post": lambda ctx, args: buzzposter_cross_post(ctx, **args),
+    "buzzposter_schedule_post": lambda ctx, args: buzzposter_schedule_post(ctx, **args),
+    "buzzposter_list_posts": lambda ctx, args: buzzposter_list_posts(ctx, **args),
+    "buzzposter_post_analytics": lambda ctx, args: buzzposter_post_analytics(ctx, **args),
+    "buzzposter_upload_media": lambda ctx, args: buzzposter_upload_media(ctx, **args),
+    "buzzposter_list_media": lambda ctx, args: buzzposter_list_media(ctx, **args),
+    "buzzposter_delete_media": lambda ctx, args: buzzposter_delete_media(ctx, **args),
+    "buzzposter_get_storage_usage": lambda ctx, args: buzzposter_get_storage_usage(ctx),
+    "buzzposter_post_with_media": lambda ctx, args: buzzposter_post_with_media(ctx, **args),
+    "buzzposter_draft_beehiiv": lambda ctx, args: buzzposter_draft_beehiiv(ctx, **args),
+    "buzzposter_publish_beehiiv": lambda ctx, args: buzzposter_publish_beehiiv(ctx, **args),
+    "buzzposter_draft_kit": lambda ctx, args: buzzposter_draft_kit(ctx, **args),
+    "buzzposter_publish_kit": lambda ctx, args: buzzposter_publish_kit(ctx, **args),
+    "buzzposter_draft_mailchimp": lambda ctx, args: buzzposter_draft_mailchimp(ctx, **args),
+    "buzzposter_publish_mailchimp": lambda ctx, args: buzzposter_publish_mailchimp(ctx, **args),
+    "buzzposter_draft_wordpress": lambda ctx, args: buzzposter_draft_wordpress(ctx, **args),
+    "buzzposter_publish_wordpress": lambda ctx, args: buzzposter_publish_wordpress(ctx, **args),
+    "buzzposter_draft_ghost": lambda ctx, args: buzzposter_draft_ghost(ctx, **args),
+    "buzzposter_publish_ghost": lambda ctx, args: buzzposter_publish_ghost(ctx, **args),
+    "buzzposter_draft_webflow": lambda ctx, args: buzzposter_draft_webflow(ctx, **args),
+    "buzzposter_publish_webflow": lambda ctx, args: buzzposter_publish_webflow(ctx, **args),
+    "buzzposter_connect_platform": lambda ctx, args: buzzposter_connect_platform(ctx, **args),
+    "buzzposter_list_integrations": lambda ctx, args: buzzposter_list_integrations(ctx),
+}
+
+
 @mcp_server.call_tool()
 async def call_tool(name: str, arguments: dict, request: Request) -> list[TextContent]:
     """Handle MCP tool calls"""
@@ -647,50 +712,13 @@ async def call_tool(name: str, arguments: dict, request: Request) -> list[TextCo
         user_ctx = await get_user_from_request(request, db)
 
         # Route to appropriate tool handler
-        tool_map = {
-            "buzzposter_get_feed": lambda: buzzposter_get_feed(user_ctx, **arguments),
-            "buzzposter_get_topic": lambda: buzzposter_get_topic(user_ctx, **arguments),
-            "buzzposter_search_news": lambda: buzzposter_search_news(user_ctx, **arguments),
-            "buzzposter_add_feed": lambda: buzzposter_add_feed(user_ctx, **arguments),
-            "buzzposter_remove_feed": lambda: buzzposter_remove_feed(user_ctx, **arguments),
-            "buzzposter_list_feeds": lambda: buzzposter_list_feeds(user_ctx),
-            "buzzposter_set_profile": lambda: buzzposter_set_profile(user_ctx, **arguments),
-            "buzzposter_my_feed": lambda: buzzposter_my_feed(user_ctx),
-            "buzzposter_list_social_accounts": lambda: buzzposter_list_social_accounts(user_ctx),
-            "buzzposter_post": lambda: buzzposter_post(user_ctx, **arguments),
-            "buzzposter_cross_post": lambda: buzzposter_cross_post(user_ctx, **arguments),
-            "buzzposter_schedule_post": lambda: buzzposter_schedule_post(user_ctx, **arguments),
-            "buzzposter_list_posts": lambda: buzzposter_list_posts(user_ctx, **arguments),
-            "buzzposter_post_analytics": lambda: buzzposter_post_analytics(user_ctx, **arguments),
-            "buzzposter_upload_media": lambda: buzzposter_upload_media(user_ctx, **arguments),
-            "buzzposter_list_media": lambda: buzzposter_list_media(user_ctx),
-            "buzzposter_delete_media": lambda: buzzposter_delete_media(user_ctx, **arguments),
-            "buzzposter_get_storage_usage": lambda: buzzposter_get_storage_usage(user_ctx),
-            "buzzposter_post_with_media": lambda: buzzposter_post_with_media(user_ctx, **arguments),
-            "buzzposter_draft_beehiiv": lambda: buzzposter_draft_beehiiv(user_ctx, **arguments),
-            "buzzposter_publish_beehiiv": lambda: buzzposter_publish_beehiiv(user_ctx, **arguments),
-            "buzzposter_draft_kit": lambda: buzzposter_draft_kit(user_ctx, **arguments),
-            "buzzposter_publish_kit": lambda: buzzposter_publish_kit(user_ctx, **arguments),
-            "buzzposter_draft_mailchimp": lambda: buzzposter_draft_mailchimp(user_ctx, **arguments),
-            "buzzposter_publish_mailchimp": lambda: buzzposter_publish_mailchimp(user_ctx, **arguments),
-            "buzzposter_draft_wordpress": lambda: buzzposter_draft_wordpress(user_ctx, **arguments),
-            "buzzposter_publish_wordpress": lambda: buzzposter_publish_wordpress(user_ctx, **arguments),
-            "buzzposter_draft_ghost": lambda: buzzposter_draft_ghost(user_ctx, **arguments),
-            "buzzposter_publish_ghost": lambda: buzzposter_publish_ghost(user_ctx, **arguments),
-            "buzzposter_draft_webflow": lambda: buzzposter_draft_webflow(user_ctx, **arguments),
-            "buzzposter_publish_webflow": lambda: buzzposter_publish_webflow(user_ctx, **arguments),
-            "buzzposter_connect_platform": lambda: buzzposter_connect_platform(user_ctx, **arguments),
-            "buzzposter_list_integrations": lambda: buzzposter_list_integrations(user_ctx),
-        }
-
-        handler = tool_map.get(name)
+        handler = TOOL_HANDLERS.get(name)
         if not handler:
             raise ValueError(f"Unknown tool: {name}")
 
-        result = await handler()
+        result = await handler(user_ctx, arguments)
 
         # Convert result to string for MCP response
-        import json
         result_text = json.dumps(result, indent=2)
 
         return [TextContent(type="text", text=result_text)]
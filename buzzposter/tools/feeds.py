@@ -3,17 +3,121 @@ RSS and NewsAPI content sourcing tools
 """
 import os
 import re
+import html
+import asyncio
+import hashlib
+import multiprocessing
+import weakref
 import httpx
+import orjson
 import feedparser
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+from feedparser.sanitizer import _sanitize_html
+import xml.sax
+import xml.sax.handler
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from bs4 import BeautifulSoup
+from bs4.builder._lxml import LXMLTreeBuilder
 from ..auth.middleware import UserContext, check_rate_limit, check_feature_access, log_usage
+from ..http_client import DEFAULT_TIMEOUT, get_http_client
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:  # pragma: no cover - C parser is optional
+    def _parse_iso_datetime(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
 
 
 NEWSAPI_KEY = os.getenv("NEWSAPI_KEY")
 NEWSAPI_BASE_URL = "https://newsapi.org/v2"
 
+# Shared read-only default for missing nested objects
+_EMPTY: Dict[str, Any] = {}
+
+# Keys of each article in feed results, in the order _feed_result fills them
+_ARTICLE_FIELDS = ("title", "link", "description", "published", "published_ts", "author", "image_url")
+
+# Upper bound on a single RSS response body; larger feeds are rejected
+MAX_FEED_BYTES = 2_000_000
+
+# Articles returned per feed; parsing stops once this many are read
+MAX_FEED_ENTRIES = 20
+
+# Most of a feed document read when only checking that a URL is a feed
+FEED_PROBE_BYTES = 65_536
+
+# Topic fan-outs fail fast on dead publisher hosts
+TOPIC_FEED_TIMEOUT = httpx.Timeout(connect=3.0, read=20.0, write=5.0, pool=5.0)
+
+# feed_url -> (etag, last_modified, parsed result) for conditional GETs,
+# kept as an LRU of at most FEED_CACHE_SIZE feeds
+FEED_CACHE_SIZE = 512
+_FEED_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+
+# Worker processes for the feedparser fallback, which is pure-Python and
+# CPU-bound; created on first use. Kept small since every server worker
+# gets its own pool and os.cpu_count() ignores container CPU quotas
+FEED_PARSE_WORKERS = int(os.getenv("FEED_PARSE_WORKERS", min(4, os.cpu_count() or 1)))
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+
+# Concurrent fetches allowed against a single feed host. Weak values: a
+# host's entry goes away once no fetch holds or waits on its semaphore
+MAX_REQUESTS_PER_HOST = 20
+_HOST_SEMAPHORES: "weakref.WeakValueDictionary[str, asyncio.Semaphore]" = weakref.WeakValueDictionary()
+
+# First <img> with a quoted src (ignores data-src/srcset); BeautifulSoup is
+# only needed when a tag is present but this pattern can't read it
+_IMG_SRC_RE = re.compile(r"""<img\b[^>]*?(?<![\w-])src\s*=\s*["']([^"']+)["']""", re.I)
+_IMG_TAG_RE = re.compile(r"<img\b", re.I)
+_OK_SCHEMES = ("http://", "https://")
+
+# One lxml HTML tree builder reused for every BeautifulSoup fallback parse,
+# skipping the builder registry lookup and construction per call
+_HTML_BUILDER = LXMLTreeBuilder()
+
+# XML namespaces understood by the streaming feed parser
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_RSS1_NS = "{http://purl.org/rss/1.0/}"
+_MEDIA_NS = "{http://search.yahoo.com/mrss/}"
+_DC_NS = "{http://purl.org/dc/elements/1.1/}"
+_CONTENT_NS = "{http://purl.org/rss/1.0/modules/content/}"
+_XHTML_NS = "http://www.w3.org/1999/xhtml"
+_ENTRY_TAGS = frozenset({"item", _RSS1_NS + "item", _ATOM_NS + "entry"})
+_CHANNEL_TAGS = frozenset({"channel", _RSS1_NS + "channel", _ATOM_NS + "feed"})
+
+# Whitelisted text elements -> feedparser-style keys
+_FEED_TEXT_FIELDS = {
+    "title": "title",
+    _RSS1_NS + "title": "title",
+    _ATOM_NS + "title": "title",
+    "description": "description",
+    _RSS1_NS + "description": "description",
+    _ATOM_NS + "subtitle": "description",
+}
+_ENTRY_TEXT_FIELDS = {
+    "title": "title",
+    _RSS1_NS + "title": "title",
+    _ATOM_NS + "title": "title",
+    "link": "link",
+    _RSS1_NS + "link": "link",
+    "description": "summary",
+    _RSS1_NS + "description": "summary",
+    _ATOM_NS + "summary": "summary",
+    "pubDate": "published",
+    _ATOM_NS + "published": "published",
+    _ATOM_NS + "updated": "updated",
+    _DC_NS + "date": "updated",
+    "author": "author",
+    _DC_NS + "creator": "author",
+    _CONTENT_NS + "encoded": "content",
+    _ATOM_NS + "content": "content",
+}
+
 
 # Built-in RSS feeds by topic
 BUILT_IN_FEEDS = {
@@ -35,6 +139,11 @@ BUILT_IN_FEEDS = {
 }
 
 
+def _ok_url(url: Any) -> bool:
+    """Whether an extracted image URL is an absolute http(s) URL"""
+    return isinstance(url, str) and url.startswith(_OK_SCHEMES)
+
+
 def extract_image_from_entry(entry: Any) -> Optional[str]:
     """
     Extract first available image URL from RSS feed entry.
@@ -49,45 +158,56 @@ def extract_image_from_entry(entry: Any) -> Optional[str]:
     Returns:
         Image URL string or None if no image found
     """
+    # Mapping lookups rather than hasattr(): FeedParserDict resolves
+    # attributes through __getattr__ and raises on every miss
     # Check media:content (common in feeds with embedded media)
-    if hasattr(entry, 'media_content') and entry.media_content:
-        for media in entry.media_content:
+    media_content = entry.get('media_content')
+    if media_content:
+        for media in media_content:
             if media.get('medium') == 'image' or media.get('type', '').startswith('image/'):
                 url = media.get('url')
-                if url:
+                if _ok_url(url):
                     return url
 
     # Check media:thumbnail
-    if hasattr(entry, 'media_thumbnail') and entry.media_thumbnail:
-        url = entry.media_thumbnail[0].get('url')
-        if url:
+    media_thumbnail = entry.get('media_thumbnail')
+    if media_thumbnail:
+        url = media_thumbnail[0].get('url')
+        if _ok_url(url):
             return url
 
     # Check enclosures for images
-    if hasattr(entry, 'enclosures'):
-        for enclosure in entry.enclosures:
+    enclosures = entry.get('enclosures')
+    if enclosures:
+        for enclosure in enclosures:
             if enclosure.get('type', '').startswith('image/'):
                 url = enclosure.get('href') or enclosure.get('url')
-                if url:
+                if _ok_url(url):
                     return url
 
     # Parse HTML content for <img> tags
-    html_content = entry.get('content', [{}])[0].get('value') if entry.get('content') else None
+    content = entry.get('content')
+    html_content = content[0].get('value') if content else None
     if not html_content:
         html_content = entry.get('summary') or entry.get('description')
 
     if html_content:
-        try:
-            soup = BeautifulSoup(html_content, 'html5lib')
-            img = soup.find('img')
-            if img and img.get('src'):
-                src = img.get('src')
-                # Validate it's a reasonable URL
-                if src and (src.startswith('http://') or src.startswith('https://')):
-                    return src
-        except Exception:
-            # Silently fail on HTML parsing errors
-            pass
+        match = _IMG_SRC_RE.search(html_content)
+        if match:
+            src = html.unescape(match.group(1))
+            if _ok_url(src):
+                return src
+        elif _IMG_TAG_RE.search(html_content):
+            try:
+                soup = BeautifulSoup(html_content, builder=_HTML_BUILDER)
+                img = soup.find('img')
+                if img:
+                    src = img.get('src')
+                    if _ok_url(src):
+                        return src
+            except Exception:
+                # Silently fail on HTML parsing errors
+                pass
 
     return None
 
@@ -105,35 +225,379 @@ async def buzzposter_get_feed(user_ctx: UserContext, feed_url: str) -> Dict[str,
     """
     await check_rate_limit(user_ctx, "buzzposter_get_feed")
 
+    result = await _fetch_feed(feed_url, DEFAULT_TIMEOUT)
+    if "error" not in result:
+        await log_usage(user_ctx, "buzzposter_get_feed")
+
+    return result
+
+
+class _StopParsing(Exception):
+    """Raised from the SAX handler once enough entries have been read"""
+
+
+class _FeedHandler(xml.sax.handler.ContentHandler):
+    """
+    Namespace-aware SAX handler that records only the feed and entry fields
+    we return. Text is buffered just for whitelisted elements; everything
+    else in the document is skipped without building any objects.
+    Entries are FeedParserDicts with the keys feedparser would produce,
+    following its rules for content-as-summary, permalink guids, inline
+    xhtml and summary sanitizing.
+    """
+
+    def __init__(self, max_entries: int):
+        super().__init__()
+        self._max_entries = max_entries
+        self._stack: List[str] = []
+        self._entry: Optional[feedparser.FeedParserDict] = None
+        self._capture: Optional[str] = None
+        self._capture_depth = 0
+        # type="xhtml" fields: nested elements are serialized, not dropped
+        self._markup = False
+        self._wrapper_depth = 0
+        self._guid_is_permalink = False
+        self._text: List[str] = []
+        self.recognized = False
+        self.feed: Dict[str, str] = {}
+        self.entries: List[feedparser.FeedParserDict] = []
+
+    def _start_capture(self, key: str, attrs: Any = None) -> None:
+        self._capture = key
+        self._capture_depth = len(self._stack)
+        self._markup = attrs is not None and _local_attrs(attrs).get("type") == "xhtml"
+        self._wrapper_depth = 0
+        self._text = []
+
+    def startElementNS(self, name, qname, attrs) -> None:
+        uri, local = name
+        tag = f"{{{uri}}}{local}" if uri else local
+        parent = self._stack[-1] if self._stack else None
+        grandparent = self._stack[-2] if len(self._stack) > 1 else None
+        if parent is None:
+            self.recognized = local in ("rss", "RDF", "feed")
+        self._stack.append(tag)
+
+        if self._capture is not None:
+            # Markup nested inside a captured field; its text is kept, and
+            # for xhtml fields the element itself, minus the wrapping <div>
+            if self._markup:
+                depth = len(self._stack)
+                if depth == self._capture_depth + 1 and uri == _XHTML_NS and local == "div" and not "".join(self._text).strip():
+                    self._wrapper_depth = depth
+                else:
+                    self._text.append("<" + local + "".join(
+                        f' {key}="{html.escape(value)}"' for key, value in _local_attrs(attrs).items()
+                    ) + ">")
+            return
+
+        if tag in _ENTRY_TAGS:
+            self._entry = feedparser.FeedParserDict()
+            return
+
+        if self._entry is None:
+            # Channel/feed level metadata
+            if parent in _CHANNEL_TAGS and tag in _FEED_TEXT_FIELDS:
+                self._start_capture(_FEED_TEXT_FIELDS[tag])
+            return
+
+        entry = self._entry
+
+        # Media elements may be nested (e.g. inside media:group)
+        if tag == _MEDIA_NS + "content":
+            entry.setdefault("media_content", []).append(_local_attrs(attrs))
+        elif tag == _MEDIA_NS + "thumbnail":
+            entry.setdefault("media_thumbnail", []).append(_local_attrs(attrs))
+        elif tag == _ATOM_NS + "name" and parent == _ATOM_NS + "author" and grandparent in _ENTRY_TAGS:
+            self._start_capture("author")
+        elif parent not in _ENTRY_TAGS:
+            # Everything else must be a direct child of the entry
+            return
+        elif tag == _ATOM_NS + "link":
+            link = _local_attrs(attrs)
+            rel = link.get("rel", "alternate")
+            if rel == "alternate":
+                entry.setdefault("link", link.get("href", ""))
+            elif rel == "enclosure":
+                entry.setdefault("enclosures", []).append(
+                    {"href": link.get("href", ""), "type": link.get("type", "")}
+                )
+        elif tag == "enclosure":
+            enclosure = _local_attrs(attrs)
+            entry.setdefault("enclosures", []).append(
+                {"href": enclosure.get("url", ""), "type": enclosure.get("type", "")}
+            )
+        elif tag == "guid":
+            self._guid_is_permalink = _local_attrs(attrs).get("isPermaLink", "true").lower() == "true"
+            self._start_capture("id")
+        elif tag in _ENTRY_TEXT_FIELDS:
+            self._start_capture(_ENTRY_TEXT_FIELDS[tag], attrs)
+
+    def endElementNS(self, name, qname) -> None:
+        if self._capture is not None and self._markup and len(self._stack) > self._capture_depth:
+            if len(self._stack) != self._wrapper_depth:
+                self._text.append(f"</{name[1]}>")
+        elif self._capture is not None and len(self._stack) == self._capture_depth:
+            text = "".join(self._text).strip()
+            target = self._entry if self._entry is not None else self.feed
+            if self._capture == "content":
+                target.setdefault("content", [{"value": text}])
+            elif self._capture == "id":
+                target.setdefault("id", text)
+                target.setdefault("guidislink", self._guid_is_permalink)
+            else:
+                target.setdefault(self._capture, text)
+            self._capture = None
+            self._text = []
+
+        tag = self._stack.pop()
+        if tag in _ENTRY_TAGS and self._entry is not None:
+            _finish_entry(self._entry)
+            self.entries.append(self._entry)
+            self._entry = None
+            if len(self.entries) >= self._max_entries:
+                raise _StopParsing()
+
+    def characters(self, content: str) -> None:
+        if self._capture is not None:
+            self._text.append(html.escape(content, quote=False) if self._markup else content)
+
+
+def _finish_entry(entry: feedparser.FeedParserDict) -> None:
+    """Apply feedparser's post-processing to a completed SAX entry"""
+    # Entries with only full content (Atom content, content:encoded) use it
+    # as their summary
+    if "summary" not in entry and "content" in entry:
+        entry["summary"] = entry["content"][0]["value"]
+    # A permalink guid stands in for a missing <link>
+    if not entry.get("link") and entry.get("guidislink") and entry.get("id"):
+        entry["link"] = entry["id"]
+    # Strip scripts, styles and unsafe attributes the way feedparser does
+    summary = entry.get("summary")
+    if summary and "<" in summary:
+        entry["summary"] = _sanitize_html(summary, "utf-8", "text/html")
+
+
+def _local_attrs(attrs: Any) -> Dict[str, str]:
+    """Convert SAX namespaced attributes to a {local_name: value} dict"""
+    return {local: value for (_, local), value in attrs.items()}
+
+
+class _FeedPullParser:
+    """
+    Incremental RSS/Atom parser fed with raw response chunks.
+    Reports done once max_entries have been read so the rest of the
+    document can be skipped. Raises xml.sax.SAXException on malformed XML.
+    """
+
+    def __init__(self, max_entries: int = MAX_FEED_ENTRIES):
+        self._handler = _FeedHandler(max_entries)
+        self._parser = xml.sax.make_parser()
+        self._parser.setFeature(xml.sax.handler.feature_namespaces, True)
+        self._parser.setContentHandler(self._handler)
+        self.done = False
+
+    @property
+    def feed(self) -> Dict[str, str]:
+        return self._handler.feed
+
+    @property
+    def entries(self) -> List[feedparser.FeedParserDict]:
+        return self._handler.entries
+
+    @property
+    def recognized(self) -> bool:
+        """Whether the root element seen so far is rss, RDF or feed"""
+        return self._handler.recognized
+
+    def feed_bytes(self, data: bytes) -> None:
+        """Feed the next chunk of the document"""
+        try:
+            self._parser.feed(data)
+        except _StopParsing:
+            self.done = True
+
+    def finish(self) -> bool:
+        """
+        Finish parsing after the last chunk.
+        Returns True if the document was a feed we can use.
+        """
+        if not self.done:
+            self._parser.close()
+        return self._handler.recognized
+
+
+def _parse_timestamp(value: Optional[str]) -> int:
+    """
+    Convert an RSS (RFC 822) or Atom (ISO 8601) date string to a Unix
+    timestamp. ISO dates go through ciso8601 when it is installed.
+    Returns 0 when the date is missing or unparseable.
+    """
+    if not value:
+        return 0
+    value = value.strip()
     try:
-        # Fetch feed
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(feed_url)
-            response.raise_for_status()
-
-        # Parse feed
-        feed = feedparser.parse(response.text)
-
-        # Extract articles
-        articles = []
-        for entry in feed.entries[:20]:  # Limit to 20 most recent
-            articles.append({
-                "title": entry.get("title", ""),
-                "link": entry.get("link", ""),
-                "description": entry.get("summary", entry.get("description", "")),
-                "published": entry.get("published", entry.get("updated", "")),
-                "author": entry.get("author", ""),
-                "image_url": extract_image_from_entry(entry),
-            })
+        # Atom dates start with the year; RSS dates with a weekday or day
+        if value[:4].isdigit():
+            dt = _parse_iso_datetime(value)
+        else:
+            dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def _feed_result(feed_info: Any, entries: List[Any]) -> Dict[str, Any]:
+    """Build the tool response from feed metadata and parsed entries"""
+    articles = []
+    for entry in entries[:MAX_FEED_ENTRIES]:
+        get = entry.get
+        published = get("published") or get("updated", "")
+        articles.append(dict(zip(_ARTICLE_FIELDS, (
+            get("title", ""),
+            get("link", ""),
+            get("summary") or get("description", ""),
+            published,
+            _parse_timestamp(published),
+            get("author", ""),
+            extract_image_from_entry(entry),
+        ))))
 
-        await log_usage(user_ctx, "buzzposter_get_feed")
+    return {
+        "feed_title": feed_info.get("title", ""),
+        "feed_description": feed_info.get("description", ""),
+        "articles": articles,
+        "total": len(articles),
+    }
 
-        return {
-            "feed_title": feed.feed.get("title", ""),
-            "feed_description": feed.feed.get("description", ""),
-            "articles": articles,
-            "total": len(articles),
-        }
+
+def _parse_feed(body: bytes) -> Dict[str, Any]:
+    """Parse a raw RSS/Atom document with feedparser (lenient fallback)"""
+    # feedparser sniffs the encoding from the raw bytes
+    feed = feedparser.parse(body)
+    return _feed_result(feed.feed, feed.entries)
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Return the feedparser worker pool, creating it on first use"""
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        # forkserver: the server is multithreaded by now, so forking it
+        # directly could deadlock a child on a lock held by another thread
+        _PARSE_POOL = ProcessPoolExecutor(
+            max_workers=FEED_PARSE_WORKERS,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+    return _PARSE_POOL
+
+
+def shutdown_parse_pool() -> None:
+    """Stop the feedparser worker pool (called on application shutdown)"""
+    global _PARSE_POOL
+    if _PARSE_POOL is not None:
+        _PARSE_POOL.shutdown(wait=False, cancel_futures=True)
+        _PARSE_POOL = None
+
+
+def _host_semaphore(url: str) -> asyncio.Semaphore:
+    """Get the semaphore bounding concurrent requests to the URL's host"""
+    host = urlsplit(url).netloc.lower()
+    semaphore = _HOST_SEMAPHORES.get(host)
+    if semaphore is None:
+        semaphore = _HOST_SEMAPHORES[host] = asyncio.Semaphore(MAX_REQUESTS_PER_HOST)
+    return semaphore
+
+
+def _article_key(link: str) -> bytes:
+    """
+    Canonical dedupe key for an article link.
+    Drops utm_* tracking parameters and the fragment before hashing.
+    """
+    parts = urlsplit(link.strip())
+    query = parts.query
+    if "utm_" in query:
+        query = urlencode([
+            (key, value) for key, value in parse_qsl(query, keep_blank_values=True)
+            if not key.startswith("utm_")
+        ])
+    canonical = urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ""))
+    return hashlib.blake2b(canonical.encode(), digest_size=8).digest()
+
+
+async def _fetch_feed(feed_url: str, timeout: httpx.Timeout) -> Dict[str, Any]:
+    """
+    Fetch and parse an RSS feed with the given request timeout.
+    Does no database work, so several can run concurrently for one user.
+    """
+    try:
+        # Send validators from the last fetch so unchanged feeds answer 304
+        cached = _FEED_CACHE.get(feed_url)
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        # Fetch feed, streaming the body into the SAX parser so we can stop
+        # reading once enough entries are in. The raw bytes are kept (up to
+        # the size cap) in case the document needs the lenient fallback.
+        body = bytearray()
+        pull_parser = _FeedPullParser()
+        pull_ok = True
+        not_modified = False
+        client = get_http_client()
+        async with _host_semaphore(feed_url):
+            async with client.stream("GET", feed_url, headers=headers, timeout=timeout) as response:
+                if response.status_code == 304 and cached:
+                    not_modified = True
+                else:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes(65536):
+                        body.extend(chunk)
+                        if pull_ok:
+                            try:
+                                pull_parser.feed_bytes(chunk)
+                            except xml.sax.SAXException:
+                                pull_ok = False
+                            else:
+                                if pull_parser.done:
+                                    break
+                        if len(body) > MAX_FEED_BYTES:
+                            return {"error": f"Feed too large (over {MAX_FEED_BYTES // 1_000_000}MB)"}
+                    etag = response.headers.get("etag")
+                    last_modified = response.headers.get("last-modified")
+
+        if not_modified:
+            # Unchanged: reuse the cached parse and mark it recently used
+            result = cached[2]
+            _FEED_CACHE[feed_url] = cached
+            _FEED_CACHE.move_to_end(feed_url)
+        else:
+            if pull_ok:
+                try:
+                    pull_ok = pull_parser.finish()
+                except xml.sax.SAXException:
+                    pull_ok = False
+            if pull_ok:
+                result = _feed_result(pull_parser.feed, pull_parser.entries)
+            else:
+                # Lenient parse in a worker process so it doesn't hold the
+                # event loop
+                result = await asyncio.get_running_loop().run_in_executor(
+                    _get_parse_pool(), _parse_feed, bytes(body)
+                )
+            if etag or last_modified:
+                _FEED_CACHE[feed_url] = (etag, last_modified, result)
+                _FEED_CACHE.move_to_end(feed_url)
+                if len(_FEED_CACHE) > FEED_CACHE_SIZE:
+                    _FEED_CACHE.popitem(last=False)
+
+        # Callers annotate articles in place, so hand out copies
+        return {**result, "articles": [dict(a) for a in result["articles"]]}
 
     except httpx.HTTPError as e:
         return {"error": f"Failed to fetch feed: {str(e)}"}
@@ -141,6 +605,79 @@ async def buzzposter_get_feed(user_ctx: UserContext, feed_url: str) -> Dict[str,
         return {"error": f"Failed to parse feed: {str(e)}"}
 
 
+async def _fetch_many_feeds(
+    feeds: Sequence[Tuple[str, httpx.Timeout]],
+    concurrency: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch (url, timeout) feeds concurrently over the shared client.
+    Results are in input order; a feed that raised comes back as an error
+    dict. concurrency, if given, bounds how many fetches are in flight.
+    """
+    if concurrency:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(url: str, timeout: httpx.Timeout) -> Dict[str, Any]:
+            async with semaphore:
+                return await _fetch_feed(url, timeout)
+    else:
+        fetch = _fetch_feed
+
+    results = await asyncio.gather(
+        *(fetch(url, timeout) for url, timeout in feeds),
+        return_exceptions=True,
+    )
+    return [
+        {"error": f"Failed to fetch feed: {str(r)}"} if isinstance(r, BaseException) else r
+        for r in results
+    ]
+
+
+async def _probe_feed(feed_url: str, timeout: httpx.Timeout) -> Optional[str]:
+    """
+    Check that a URL serves an RSS/Atom feed without downloading all of it.
+    Reads until the first entry (or FEED_PROBE_BYTES) and checks the root
+    element. Returns an error message, or None if the URL looks like a feed.
+    """
+    try:
+        body = bytearray()
+        pull_parser = _FeedPullParser(max_entries=1)
+        pull_ok = True
+        complete = True
+        client = get_http_client()
+        async with _host_semaphore(feed_url):
+            async with client.stream("GET", feed_url, timeout=timeout) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(16384):
+                    body.extend(chunk)
+                    if pull_ok:
+                        try:
+                            pull_parser.feed_bytes(chunk)
+                        except xml.sax.SAXException:
+                            pull_ok = False
+                    if pull_parser.done or len(body) >= FEED_PROBE_BYTES:
+                        complete = False
+                        break
+
+        if pull_ok and complete:
+            try:
+                pull_parser.finish()
+            except xml.sax.SAXException:
+                pull_ok = False
+        if pull_ok:
+            is_feed = pull_parser.recognized
+        else:
+            # Malformed XML; let feedparser decide from what was read
+            is_feed = bool(feedparser.parse(bytes(body)).version)
+
+        return None if is_feed else "URL did not return an RSS or Atom feed"
+
+    except httpx.HTTPError as e:
+        return f"Failed to fetch feed: {str(e)}"
+    except Exception as e:
+        return f"Failed to parse feed: {str(e)}"
+
+
 async def buzzposter_get_topic(user_ctx: UserContext, topic: str) -> Dict[str, Any]:
     """
     Get news articles from built-in topic feeds
@@ -163,20 +700,26 @@ async def buzzposter_get_topic(user_ctx: UserContext, topic: str) -> Dict[str, A
     if not feeds:
         return {"error": f"Unknown topic: {topic}. Available: {', '.join(BUILT_IN_FEEDS.keys())}"}
 
-    # Fetch all feeds for this topic
+    # Fetch all feeds for this topic concurrently; a failing feed is skipped
+    results = await _fetch_many_feeds([(feed_info["url"], TOPIC_FEED_TIMEOUT) for feed_info in feeds])
+
+    # Feeds in a topic often syndicate the same story; keep the first copy
     all_articles = []
-    for feed_info in feeds:
-        result = await buzzposter_get_feed(user_ctx, feed_info["url"])
+    seen = set()
+    for feed_info, result in zip(feeds, results):
         if "articles" in result:
             for article in result["articles"]:
+                link = article["link"]
+                if link:
+                    key = _article_key(link)
+                    if key in seen:
+                        continue
+                    seen.add(key)
                 article["source"] = feed_info["name"]
-            all_articles.extend(result["articles"])
+                all_articles.append(article)
 
     # Sort by published date (most recent first)
-    all_articles.sort(
-        key=lambda x: x.get("published", ""),
-        reverse=True
-    )
+    all_articles.sort(key=itemgetter("published_ts"), reverse=True)
 
     await log_usage(user_ctx, "buzzposter_get_topic")
 
@@ -213,32 +756,33 @@ async def buzzposter_search_news(
         return {"error": "NewsAPI key not configured on server"}
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{NEWSAPI_BASE_URL}/everything",
-                params={
-                    "q": query,
-                    "language": language,
-                    "sortBy": sort_by,
-                    "pageSize": 20,
-                    "apiKey": NEWSAPI_KEY,
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
+        client = get_http_client()
+        response = await client.get(
+            f"{NEWSAPI_BASE_URL}/everything",
+            params={
+                "q": query,
+                "language": language,
+                "sortBy": sort_by,
+                "pageSize": 20,
+                "apiKey": NEWSAPI_KEY,
+            }
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
         # Transform to consistent format
-        articles = []
-        for article in data.get("articles", []):
-            articles.append({
+        articles = [
+            {
                 "title": article.get("title", ""),
                 "link": article.get("url", ""),
                 "description": article.get("description", ""),
                 "published": article.get("publishedAt", ""),
                 "author": article.get("author", ""),
-                "source": article.get("source", {}).get("name", ""),
+                "source": (article.get("source") or _EMPTY).get("name", ""),
                 "image_url": article.get("urlToImage", ""),
-            })
+            }
+            for article in data.get("articles") or ()
+        ]
 
         await log_usage(user_ctx, "buzzposter_search_news")
 
@@ -3,16 +3,24 @@ Newsletter and CMS integration tools for BuzzPoster
 Supports: Beehiiv, Kit/ConvertKit, Mailchimp, WordPress, Ghost, Webflow
 """
 import os
+import re
 import json
 import base64
 import httpx
+import orjson
 import hashlib
 import hmac
-from typing import Dict, Any, Optional
+import time
+import unicodedata
+import jwt
+from dataclasses import dataclass
+from typing import Callable, Dict, Any, FrozenSet, Optional, Tuple
 from datetime import datetime
+from functools import partial
 from sqlalchemy import select
 
 from ..auth.middleware import UserContext, check_rate_limit, check_feature_access, log_usage
+from ..http_client import get_http_client
 from ..db.models import UserIntegration
 
 
@@ -20,8 +28,39 @@ from ..db.models import UserIntegration
 # Helper Functions
 # =============================================================================
 
-async def get_integration(user_ctx: UserContext, platform: str) -> Optional[UserIntegration]:
-    """Get user's integration for a specific platform"""
+@dataclass(frozen=True)
+class IntegrationInfo:
+    """Read-only snapshot of a UserIntegration row, safe to share across sessions"""
+    platform: str
+    access_token: Optional[str]
+    refresh_token: Optional[str]
+    metadata: Optional[Dict[str, Any]]
+    # Derived from the access token once per cache fill (Mailchimp only)
+    api_base: Optional[str] = None
+    auth_header: Optional[str] = None
+
+
+# (user_id, platform) -> (expires_at, integration or None)
+INTEGRATION_CACHE_TTL = 60.0
+INTEGRATION_CACHE_SIZE = 10_000
+_INTEGRATION_CACHE: Dict[Tuple[int, str], Tuple[float, Optional[IntegrationInfo]]] = {}
+
+
+def _json_headers(authorization: str) -> Dict[str, str]:
+    """Request headers for a JSON body serialized with orjson"""
+    return {"Authorization": authorization, "Content-Type": "application/json"}
+
+
+def _mailchimp_auth(access_token: str) -> Tuple[str, str]:
+    """Return (API base URL, Authorization header) for a Mailchimp API key"""
+    # Extract DC from API key (format: key-dc)
+    dc = access_token.split("-")[-1] if "-" in access_token else "us1"
+    auth_header = base64.b64encode(f"anystring:{access_token}".encode()).decode()
+    return f"https://{dc}.api.mailchimp.com/3.0", f"Basic {auth_header}"
+
+
+async def _load_integration(user_ctx: UserContext, platform: str) -> Optional[UserIntegration]:
+    """Load the user's integration row for a platform from the database"""
     stmt = select(UserIntegration).where(
         UserIntegration.user_id == user_ctx.user.id,
         UserIntegration.platform == platform
@@ -30,10 +69,136 @@ async def get_integration(user_ctx: UserContext, platform: str) -> Optional[User
     return result.scalar_one_or_none()
 
 
+async def get_integration(user_ctx: UserContext, platform: str) -> Optional[IntegrationInfo]:
+    """
+    Get user's integration for a specific platform.
+    Lookups are cached for INTEGRATION_CACHE_TTL seconds; call
+    invalidate_integration() after changing a user's credentials.
+    """
+    key = (user_ctx.user.id, platform)
+    now = time.monotonic()
+
+    cached = _INTEGRATION_CACHE.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    stmt = select(
+        UserIntegration.platform,
+        UserIntegration.access_token,
+        UserIntegration.refresh_token,
+        UserIntegration.metadata
+    ).where(
+        UserIntegration.user_id == user_ctx.user.id,
+        UserIntegration.platform == platform
+    )
+    result = await user_ctx.db.execute(stmt)
+    row = result.one_or_none()
+    info = None
+    if row:
+        api_base = auth_header = None
+        if row.platform == "mailchimp" and row.access_token:
+            api_base, auth_header = _mailchimp_auth(row.access_token)
+        info = IntegrationInfo(
+            platform=row.platform,
+            access_token=row.access_token,
+            refresh_token=row.refresh_token,
+            metadata=row.metadata,
+            api_base=api_base,
+            auth_header=auth_header,
+        )
+
+    _INTEGRATION_CACHE.pop(key, None)
+    if len(_INTEGRATION_CACHE) >= INTEGRATION_CACHE_SIZE:
+        # Drop the oldest entry (dicts keep insertion order)
+        _INTEGRATION_CACHE.pop(next(iter(_INTEGRATION_CACHE)))
+    _INTEGRATION_CACHE[key] = (now + INTEGRATION_CACHE_TTL, info)
+    return info
+
+
+def invalidate_integration(user_id: int, platform: str) -> None:
+    """Drop a cached integration lookup"""
+    _INTEGRATION_CACHE.pop((user_id, platform), None)
+
+
+@dataclass(frozen=True)
+class _PlatformCfg:
+    """Static settings for a platform whose publish tools are a single POST"""
+    platform: str
+    label: str
+    url_tmpl: str
+    auth_fn: Callable[[IntegrationInfo], str]
+    required: Tuple[str, ...] = ()
+    missing_error: str = ""
+
+
+def _bearer_auth(integration: IntegrationInfo) -> str:
+    return f"Bearer {integration.access_token}"
+
+
+def _wordpress_auth(integration: IntegrationInfo) -> str:
+    # WordPress uses Application Password for Basic auth
+    username = integration.metadata["username"]
+    credentials = base64.b64encode(f"{username}:{integration.access_token}".encode()).decode()
+    return f"Basic {credentials}"
+
+
+async def _post_platform(
+    cfg: _PlatformCfg,
+    user_ctx: UserContext,
+    tool_name: str,
+    payload: Dict[str, Any]
+) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Run the shared checks and POST payload to the platform's create endpoint.
+    Returns (response data, None) on success or (None, error dict).
+    """
+    # The tier check needs no database work, so it runs first. The remaining
+    # lookups share one AsyncSession and must stay sequential
+    await check_feature_access(user_ctx, "integrations")
+    await check_rate_limit(user_ctx, tool_name)
+
+    integration = await get_integration(user_ctx, cfg.platform)
+    if not integration:
+        return None, {"error": f"{cfg.label} not connected. Use buzzposter_connect_platform first."}
+
+    metadata = integration.metadata or {}
+    if not all(metadata.get(key) for key in cfg.required):
+        return None, {"error": cfg.missing_error}
+
+    # Trailing slashes are dropped so site URLs join cleanly with the path
+    url = cfg.url_tmpl.format(**{key: str(metadata[key]).rstrip("/") for key in cfg.required})
+
+    try:
+        response = await get_http_client().post(
+            url,
+            headers=_json_headers(cfg.auth_fn(integration)),
+            content=orjson.dumps(payload)
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+    except (httpx.HTTPError, ValueError) as e:
+        # ValueError covers malformed stored credentials (e.g. a bad Ghost key)
+        # and non-JSON response bodies (orjson.JSONDecodeError)
+        return None, {"error": f"{cfg.label} API error: {str(e)}"}
+
+    await log_usage(user_ctx, tool_name)
+    return data, None
+
+
 # =============================================================================
 # Beehiiv Integration
 # =============================================================================
 
+_post_beehiiv = partial(_post_platform, _PlatformCfg(
+    platform="beehiiv",
+    label="Beehiiv",
+    url_tmpl="https://api.beehiiv.com/v2/publications/{publication_id}/posts",
+    auth_fn=_bearer_auth,
+    required=("publication_id",),
+    missing_error="Beehiiv publication ID not configured",
+))
+
+
 async def buzzposter_draft_beehiiv(
     user_ctx: UserContext,
     title: str,
@@ -52,44 +217,22 @@ async def buzzposter_draft_beehiiv(
     Returns:
         Dict with post info or error
     """
-    await check_rate_limit(user_ctx, "buzzposter_draft_beehiiv")
-    await check_feature_access(user_ctx, "integrations")
-
-    integration = await get_integration(user_ctx, "beehiiv")
-    if not integration:
-        return {"error": "Beehiiv not connected. Use buzzposter_connect_platform first."}
-
-    pub_id = integration.metadata.get("publication_id") if integration.metadata else None
-    if not pub_id:
-        return {"error": "Beehiiv publication ID not configured"}
-
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"https://api.beehiiv.com/v2/publications/{pub_id}/posts",
-                headers={"Authorization": f"Bearer {integration.access_token}"},
-                json={
-                    "title": title,
-                    "content_html": content,
-                    "status": "draft",
-                    "preview_text": preview_text or title[:100]
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-
-        await log_usage(user_ctx, "buzzposter_draft_beehiiv")
-
-        return {
-            "success": True,
-            "platform": "beehiiv",
-            "status": "draft",
-            "post_id": data.get("data", {}).get("id"),
-            "title": title
-        }
-
-    except httpx.HTTPError as e:
-        return {"error": f"Beehiiv API error: {str(e)}"}
+    data, error = await _post_beehiiv(user_ctx, "buzzposter_draft_beehiiv", {
+        "title": title,
+        "content_html": content,
+        "status": "draft",
+        "preview_text": preview_text or title[:100]
+    })
+    if error:
+        return error
+
+    return {
+        "success": True,
+        "platform": "beehiiv",
+        "status": "draft",
+        "post_id": data.get("data", {}).get("id"),
+        "title": title
+    }
 
 
 async def buzzposter_publish_beehiiv(
@@ -111,51 +254,37 @@ async def buzzposter_publish_beehiiv(
     Returns:
         Dict with post info or error
     """
-    await check_rate_limit(user_ctx, "buzzposter_publish_beehiiv")
-    await check_feature_access(user_ctx, "integrations")
-
-    integration = await get_integration(user_ctx, "beehiiv")
-    if not integration:
-        return {"error": "Beehiiv not connected. Use buzzposter_connect_platform first."}
-
-    pub_id = integration.metadata.get("publication_id") if integration.metadata else None
-    if not pub_id:
-        return {"error": "Beehiiv publication ID not configured"}
-
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"https://api.beehiiv.com/v2/publications/{pub_id}/posts",
-                headers={"Authorization": f"Bearer {integration.access_token}"},
-                json={
-                    "title": title,
-                    "content_html": content,
-                    "status": "confirmed",
-                    "preview_text": preview_text or title[:100]
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-
-        await log_usage(user_ctx, "buzzposter_publish_beehiiv")
-
-        return {
-            "success": True,
-            "platform": "beehiiv",
-            "status": "confirmed",
-            "post_id": data.get("data", {}).get("id"),
-            "title": title,
-            "note": "Post created as confirmed. Sending requires Enterprise plan."
-        }
-
-    except httpx.HTTPError as e:
-        return {"error": f"Beehiiv API error: {str(e)}"}
+    data, error = await _post_beehiiv(user_ctx, "buzzposter_publish_beehiiv", {
+        "title": title,
+        "content_html": content,
+        "status": "confirmed",
+        "preview_text": preview_text or title[:100]
+    })
+    if error:
+        return error
+
+    return {
+        "success": True,
+        "platform": "beehiiv",
+        "status": "confirmed",
+        "post_id": data.get("data", {}).get("id"),
+        "title": title,
+        "note": "Post created as confirmed. Sending requires Enterprise plan."
+    }
 
 
 # =============================================================================
 # Kit/ConvertKit Integration
 # =============================================================================
 
+_post_kit = partial(_post_platform, _PlatformCfg(
+    platform="kit",
+    label="Kit",
+    url_tmpl="https://api.kit.com/v4/broadcasts",
+    auth_fn=_bearer_auth,
+))
+
+
 async def buzzposter_draft_kit(
     user_ctx: UserContext,
     subject: str,
@@ -174,40 +303,22 @@ async def buzzposter_draft_kit(
     Returns:
         Dict with broadcast info or error
     """
-    await check_rate_limit(user_ctx, "buzzposter_draft_kit")
-    await check_feature_access(user_ctx, "integrations")
-
-    integration = await get_integration(user_ctx, "kit")
-    if not integration:
-        return {"error": "Kit not connected. Use buzzposter_connect_platform first."}
-
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                "https://api.kit.com/v4/broadcasts",
-                headers={"Authorization": f"Bearer {integration.access_token}"},
-                json={
-                    "subject": subject,
-                    "content": content,
-                    "preview_text": preview_text or subject[:100],
-                    "published": False
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-
-        await log_usage(user_ctx, "buzzposter_draft_kit")
-
-        return {
-            "success": True,
-            "platform": "kit",
-            "status": "draft",
-            "broadcast_id": data.get("broadcast", {}).get("id"),
-            "subject": subject
-        }
-
-    except httpx.HTTPError as e:
-        return {"error": f"Kit API error: {str(e)}"}
+    data, error = await _post_kit(user_ctx, "buzzposter_draft_kit", {
+        "subject": subject,
+        "content": content,
+        "preview_text": preview_text or subject[:100],
+        "published": False
+    })
+    if error:
+        return error
+
+    return {
+        "success": True,
+        "platform": "kit",
+        "status": "draft",
+        "broadcast_id": data.get("broadcast", {}).get("id"),
+        "subject": subject
+    }
 
 
 async def buzzposter_publish_kit(
@@ -228,46 +339,72 @@ async def buzzposter_publish_kit(
     Returns:
         Dict with broadcast info or error
     """
-    await check_rate_limit(user_ctx, "buzzposter_publish_kit")
-    await check_feature_access(user_ctx, "integrations")
-
-    integration = await get_integration(user_ctx, "kit")
-    if not integration:
-        return {"error": "Kit not connected. Use buzzposter_connect_platform first."}
-
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                "https://api.kit.com/v4/broadcasts",
-                headers={"Authorization": f"Bearer {integration.access_token}"},
-                json={
-                    "subject": subject,
-                    "content": content,
-                    "preview_text": preview_text or subject[:100],
-                    "published": True
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-
-        await log_usage(user_ctx, "buzzposter_publish_kit")
-
-        return {
-            "success": True,
-            "platform": "kit",
-            "status": "sent",
-            "broadcast_id": data.get("broadcast", {}).get("id"),
-            "subject": subject
-        }
-
-    except httpx.HTTPError as e:
-        return {"error": f"Kit API error: {str(e)}"}
+    data, error = await _post_kit(user_ctx, "buzzposter_publish_kit", {
+        "subject": subject,
+        "content": content,
+        "preview_text": preview_text or subject[:100],
+        "published": True
+    })
+    if error:
+        return error
+
+    return {
+        "success": True,
+        "platform": "kit",
+        "status": "sent",
+        "broadcast_id": data.get("broadcast", {}).get("id"),
+        "subject": subject
+    }
 
 
 # =============================================================================
 # Mailchimp Integration
 # =============================================================================
 
+async def _create_mailchimp_campaign(
+    integration: IntegrationInfo,
+    list_id: str,
+    subject: str,
+    preview_text: Optional[str]
+) -> str:
+    """
+    Create an empty Mailchimp campaign.
+    Returns the campaign ID; raises httpx.HTTPError on API failure.
+    """
+    campaign_response = await get_http_client().post(
+        f"{integration.api_base}/campaigns",
+        headers=_json_headers(integration.auth_header),
+        content=orjson.dumps({
+            "type": "regular",
+            "recipients": {"list_id": list_id},
+            "settings": {
+                "subject_line": subject,
+                "preview_text": preview_text or subject[:100],
+                "from_name": integration.metadata.get("from_name", "Newsletter"),
+                "reply_to": integration.metadata.get("reply_to", "noreply@example.com")
+            }
+        })
+    )
+    campaign_response.raise_for_status()
+    try:
+        return orjson.loads(campaign_response.content)["id"]
+    except (ValueError, KeyError, TypeError) as e:
+        # Surface an unreadable body as an API failure for the callers' handlers
+        raise httpx.DecodingError(
+            f"Unexpected campaign response: {e!r}", request=campaign_response.request
+        ) from e
+
+
+async def _set_mailchimp_content(integration: IntegrationInfo, campaign_id: str, content: str) -> None:
+    """Set a campaign's HTML content; raises httpx.HTTPError on API failure"""
+    content_response = await get_http_client().put(
+        f"{integration.api_base}/campaigns/{campaign_id}/content",
+        headers=_json_headers(integration.auth_header),
+        content=orjson.dumps({"html": content})
+    )
+    content_response.raise_for_status()
+
+
 async def buzzposter_draft_mailchimp(
     user_ctx: UserContext,
     subject: str,
@@ -286,8 +423,8 @@ async def buzzposter_draft_mailchimp(
     Returns:
         Dict with campaign info or error
     """
-    await check_rate_limit(user_ctx, "buzzposter_draft_mailchimp")
     await check_feature_access(user_ctx, "integrations")
+    await check_rate_limit(user_ctx, "buzzposter_draft_mailchimp")
 
     integration = await get_integration(user_ctx, "mailchimp")
     if not integration:
@@ -297,40 +434,9 @@ async def buzzposter_draft_mailchimp(
     if not list_id:
         return {"error": "Mailchimp list ID not configured"}
 
-    # Extract DC from API key (format: key-dc)
-    dc = integration.access_token.split("-")[-1] if "-" in integration.access_token else "us1"
-
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Create campaign
-            auth_header = base64.b64encode(f"anystring:{integration.access_token}".encode()).decode()
-
-            campaign_response = await client.post(
-                f"https://{dc}.api.mailchimp.com/3.0/campaigns",
-                headers={"Authorization": f"Basic {auth_header}"},
-                json={
-                    "type": "regular",
-                    "recipients": {"list_id": list_id},
-                    "settings": {
-                        "subject_line": subject,
-                        "preview_text": preview_text or subject[:100],
-                        "from_name": integration.metadata.get("from_name", "Newsletter"),
-                        "reply_to": integration.metadata.get("reply_to", "noreply@example.com")
-                    }
-                }
-            )
-            campaign_response.raise_for_status()
-            campaign_data = campaign_response.json()
-            campaign_id = campaign_data["id"]
-
-            # Set content
-            content_response = await client.put(
-                f"https://{dc}.api.mailchimp.com/3.0/campaigns/{campaign_id}/content",
-                headers={"Authorization": f"Basic {auth_header}"},
-                json={"html": content}
-            )
-            content_response.raise_for_status()
-
+        campaign_id = await _create_mailchimp_campaign(integration, list_id, subject, preview_text)
+        await _set_mailchimp_content(integration, campaign_id, content)
         await log_usage(user_ctx, "buzzposter_draft_mailchimp")
 
         return {
@@ -363,28 +469,31 @@ async def buzzposter_publish_mailchimp(
     Returns:
         Dict with campaign info or error
     """
-    await check_rate_limit(user_ctx, "buzzposter_publish_mailchimp")
     await check_feature_access(user_ctx, "integrations")
+    await check_rate_limit(user_ctx, "buzzposter_publish_mailchimp")
 
-    # First create draft
-    draft_result = await buzzposter_draft_mailchimp(user_ctx, subject, content, preview_text)
-    if "error" in draft_result:
-        return draft_result
-
-    campaign_id = draft_result["campaign_id"]
     integration = await get_integration(user_ctx, "mailchimp")
-    dc = integration.access_token.split("-")[-1] if "-" in integration.access_token else "us1"
+    if not integration:
+        return {"error": "Mailchimp not connected. Use buzzposter_connect_platform first."}
+
+    list_id = integration.metadata.get("list_id") if integration.metadata else None
+    if not list_id:
+        return {"error": "Mailchimp list ID not configured"}
 
+    # First create draft
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            auth_header = base64.b64encode(f"anystring:{integration.access_token}".encode()).decode()
+        campaign_id = await _create_mailchimp_campaign(integration, list_id, subject, preview_text)
+        await _set_mailchimp_content(integration, campaign_id, content)
+    except httpx.HTTPError as e:
+        return {"error": f"Mailchimp API error: {str(e)}"}
 
-            # Send campaign
-            send_response = await client.post(
-                f"https://{dc}.api.mailchimp.com/3.0/campaigns/{campaign_id}/actions/send",
-                headers={"Authorization": f"Basic {auth_header}"}
-            )
-            send_response.raise_for_status()
+    try:
+        # Send campaign
+        send_response = await get_http_client().post(
+            f"{integration.api_base}/campaigns/{campaign_id}/actions/send",
+            headers={"Authorization": integration.auth_header}
+        )
+        send_response.raise_for_status()
 
         await log_usage(user_ctx, "buzzposter_publish_mailchimp")
 
@@ -404,6 +513,16 @@ async def buzzposter_publish_mailchimp(
 # WordPress Integration
 # =============================================================================
 
+_post_wordpress = partial(_post_platform, _PlatformCfg(
+    platform="wordpress",
+    label="WordPress",
+    url_tmpl="{site_url}/wp-json/wp/v2/posts",
+    auth_fn=_wordpress_auth,
+    required=("site_url", "username"),
+    missing_error="WordPress site URL or username not configured",
+))
+
+
 async def buzzposter_draft_wordpress(
     user_ctx: UserContext,
     title: str,
@@ -420,49 +539,22 @@ async def buzzposter_draft_wordpress(
     Returns:
         Dict with post info or error
     """
-    await check_rate_limit(user_ctx, "buzzposter_draft_wordpress")
-    await check_feature_access(user_ctx, "integrations")
-
-    integration = await get_integration(user_ctx, "wordpress")
-    if not integration:
-        return {"error": "WordPress not connected. Use buzzposter_connect_platform first."}
-
-    site_url = integration.metadata.get("site_url") if integration.metadata else None
-    username = integration.metadata.get("username") if integration.metadata else None
-
-    if not site_url or not username:
-        return {"error": "WordPress site URL or username not configured"}
-
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # WordPress uses Application Password for Basic auth
-            auth_header = base64.b64encode(f"{username}:{integration.access_token}".encode()).decode()
-
-            response = await client.post(
-                f"{site_url.rstrip('/')}/wp-json/wp/v2/posts",
-                headers={"Authorization": f"Basic {auth_header}"},
-                json={
-                    "title": title,
-                    "content": content,
-                    "status": "draft"
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-
-        await log_usage(user_ctx, "buzzposter_draft_wordpress")
-
-        return {
-            "success": True,
-            "platform": "wordpress",
-            "status": "draft",
-            "post_id": data.get("id"),
-            "title": title,
-            "url": data.get("link")
-        }
-
-    except httpx.HTTPError as e:
-        return {"error": f"WordPress API error: {str(e)}"}
+    data, error = await _post_wordpress(user_ctx, "buzzposter_draft_wordpress", {
+        "title": title,
+        "content": content,
+        "status": "draft"
+    })
+    if error:
+        return error
+
+    return {
+        "success": True,
+        "platform": "wordpress",
+        "status": "draft",
+        "post_id": data.get("id"),
+        "title": title,
+        "url": data.get("link")
+    }
 
 
 async def buzzposter_publish_wordpress(
@@ -481,74 +573,109 @@ async def buzzposter_publish_wordpress(
     Returns:
         Dict with post info or error
     """
-    await check_rate_limit(user_ctx, "buzzposter_publish_wordpress")
-    await check_feature_access(user_ctx, "integrations")
-
-    integration = await get_integration(user_ctx, "wordpress")
-    if not integration:
-        return {"error": "WordPress not connected. Use buzzposter_connect_platform first."}
-
-    site_url = integration.metadata.get("site_url") if integration.metadata else None
-    username = integration.metadata.get("username") if integration.metadata else None
-
-    if not site_url or not username:
-        return {"error": "WordPress site URL or username not configured"}
-
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            auth_header = base64.b64encode(f"{username}:{integration.access_token}".encode()).decode()
-
-            response = await client.post(
-                f"{site_url.rstrip('/')}/wp-json/wp/v2/posts",
-                headers={"Authorization": f"Basic {auth_header}"},
-                json={
-                    "title": title,
-                    "content": content,
-                    "status": "publish"
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-
-        await log_usage(user_ctx, "buzzposter_publish_wordpress")
-
-        return {
-            "success": True,
-            "platform": "wordpress",
-            "status": "published",
-            "post_id": data.get("id"),
-            "title": title,
-            "url": data.get("link")
-        }
-
-    except httpx.HTTPError as e:
-        return {"error": f"WordPress API error: {str(e)}"}
+    data, error = await _post_wordpress(user_ctx, "buzzposter_publish_wordpress", {
+        "title": title,
+        "content": content,
+        "status": "publish"
+    })
+    if error:
+        return error
+
+    return {
+        "success": True,
+        "platform": "wordpress",
+        "status": "published",
+        "post_id": data.get("id"),
+        "title": title,
+        "url": data.get("link")
+    }
 
 
 # =============================================================================
 # Ghost Integration
 # =============================================================================
 
+# api_key -> (token, exp); tokens are reused until close to expiry
+GHOST_JWT_TTL = 300
+GHOST_JWT_MIN_REMAINING = 30
+GHOST_JWT_CACHE_SIZE = 1024
+_GHOST_JWT_CACHE: Dict[str, Tuple[str, int]] = {}
+
+# Signs pre-serialized payloads directly, skipping PyJWT's claim handling
+_GHOST_JWS = jwt.PyJWS(algorithms=["HS256"])
+
+
 def _generate_ghost_jwt(api_key: str) -> str:
-    """Generate JWT for Ghost Admin API"""
-    import jwt
+    """Generate JWT for Ghost Admin API, reusing a cached one while still valid"""
+    now = int(time.time())
+    cached = _GHOST_JWT_CACHE.get(api_key)
+    if cached and cached[1] - now > GHOST_JWT_MIN_REMAINING:
+        return cached[0]
 
     # Split key into ID and SECRET
     key_id, secret = api_key.split(":")
 
     # Create JWT
-    iat = int(datetime.utcnow().timestamp())
     header = {"alg": "HS256", "typ": "JWT", "kid": key_id}
-    payload = {
-        "iat": iat,
-        "exp": iat + 300,  # 5 minutes
+    payload = orjson.dumps({
+        "iat": now,
+        "exp": now + GHOST_JWT_TTL,  # 5 minutes
         "aud": "/admin/"
-    }
+    })
+
+    token = _GHOST_JWS.encode(payload, bytes.fromhex(secret), algorithm="HS256", headers=header)
 
-    token = jwt.encode(payload, bytes.fromhex(secret), algorithm="HS256", headers=header)
+    _GHOST_JWT_CACHE.pop(api_key, None)
+    if len(_GHOST_JWT_CACHE) >= GHOST_JWT_CACHE_SIZE:
+        # Drop the oldest entry (dicts keep insertion order)
+        _GHOST_JWT_CACHE.pop(next(iter(_GHOST_JWT_CACHE)))
+    _GHOST_JWT_CACHE[api_key] = (token, now + GHOST_JWT_TTL)
     return token
 
 
+def _ghost_auth(integration: IntegrationInfo) -> str:
+    return f"Ghost {_generate_ghost_jwt(integration.access_token)}"
+
+
+_post_ghost = partial(_post_platform, _PlatformCfg(
+    platform="ghost",
+    label="Ghost",
+    url_tmpl="{site_url}/ghost/api/admin/posts/",
+    auth_fn=_ghost_auth,
+    required=("site_url",),
+    missing_error="Ghost site URL not configured",
+))
+
+
+async def _create_ghost_post(
+    user_ctx: UserContext,
+    tool_name: str,
+    title: str,
+    content: str,
+    status: str
+) -> Dict[str, Any]:
+    """Create a Ghost post with the given status; shared by both tools"""
+    data, error = await _post_ghost(user_ctx, tool_name, {
+        "posts": [{
+            "title": title,
+            "html": content,
+            "status": status
+        }]
+    })
+    if error:
+        return error
+
+    post = data.get("posts", [{}])[0]
+    return {
+        "success": True,
+        "platform": "ghost",
+        "status": status,
+        "post_id": post.get("id"),
+        "title": title,
+        "url": post.get("url")
+    }
+
+
 async def buzzposter_draft_ghost(
     user_ctx: UserContext,
     title: str,
@@ -565,49 +692,7 @@ async def buzzposter_draft_ghost(
     Returns:
         Dict with post info or error
     """
-    await check_rate_limit(user_ctx, "buzzposter_draft_ghost")
-    await check_feature_access(user_ctx, "integrations")
-
-    integration = await get_integration(user_ctx, "ghost")
-    if not integration:
-        return {"error": "Ghost not connected. Use buzzposter_connect_platform first."}
-
-    site_url = integration.metadata.get("site_url") if integration.metadata else None
-    if not site_url:
-        return {"error": "Ghost site URL not configured"}
-
-    try:
-        token = _generate_ghost_jwt(integration.access_token)
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{site_url.rstrip('/')}/ghost/api/admin/posts/",
-                headers={"Authorization": f"Ghost {token}"},
-                json={
-                    "posts": [{
-                        "title": title,
-                        "html": content,
-                        "status": "draft"
-                    }]
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-
-        await log_usage(user_ctx, "buzzposter_draft_ghost")
-
-        post = data.get("posts", [{}])[0]
-        return {
-            "success": True,
-            "platform": "ghost",
-            "status": "draft",
-            "post_id": post.get("id"),
-            "title": title,
-            "url": post.get("url")
-        }
-
-    except Exception as e:
-        return {"error": f"Ghost API error: {str(e)}"}
+    return await _create_ghost_post(user_ctx, "buzzposter_draft_ghost", title, content, "draft")
 
 
 async def buzzposter_publish_ghost(
@@ -626,54 +711,70 @@ async def buzzposter_publish_ghost(
     Returns:
         Dict with post info or error
     """
-    await check_rate_limit(user_ctx, "buzzposter_publish_ghost")
-    await check_feature_access(user_ctx, "integrations")
+    return await _create_ghost_post(user_ctx, "buzzposter_publish_ghost", title, content, "published")
 
-    integration = await get_integration(user_ctx, "ghost")
-    if not integration:
-        return {"error": "Ghost not connected. Use buzzposter_connect_platform first."}
 
-    site_url = integration.metadata.get("site_url") if integration.metadata else None
-    if not site_url:
-        return {"error": "Ghost site URL not configured"}
+# =============================================================================
+# Webflow Integration
+# =============================================================================
 
-    try:
-        token = _generate_ghost_jwt(integration.access_token)
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{site_url.rstrip('/')}/ghost/api/admin/posts/",
-                headers={"Authorization": f"Ghost {token}"},
-                json={
-                    "posts": [{
-                        "title": title,
-                        "html": content,
-                        "status": "published"
-                    }]
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
+# Runs of anything other than lowercase letters and digits become one hyphen
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
 
-        await log_usage(user_ctx, "buzzposter_publish_ghost")
 
-        post = data.get("posts", [{}])[0]
-        return {
-            "success": True,
-            "platform": "ghost",
-            "status": "published",
-            "post_id": post.get("id"),
-            "title": title,
-            "url": post.get("url")
-        }
+def _webflow_slug(title: str) -> str:
+    """
+    URL slug for a Webflow item (lowercase letters, digits and hyphens, max 100 chars).
+    Accented Latin letters are folded to ASCII; titles with nothing left
+    (e.g. non-Latin scripts) get a unique post-<hash> slug, since Webflow
+    requires slugs to be unique within a collection.
+    """
+    ascii_title = unicodedata.normalize("NFKD", title).encode("ascii", "ignore").decode("ascii")
+    slug = _SLUG_RE.sub("-", ascii_title.lower())[:100].strip("-")
+    if slug:
+        return slug
+    digest = hashlib.blake2b(f"{title}\0{time.time_ns()}".encode(), digest_size=5).hexdigest()
+    return f"post-{digest}"
 
-    except Exception as e:
-        return {"error": f"Ghost API error: {str(e)}"}
 
+_post_webflow = partial(_post_platform, _PlatformCfg(
+    platform="webflow",
+    label="Webflow",
+    url_tmpl="https://api.webflow.com/v2/collections/{collection_id}/items",
+    auth_fn=_bearer_auth,
+    required=("collection_id",),
+    missing_error="Webflow collection ID not configured",
+))
+
+
+async def _create_webflow_item(
+    user_ctx: UserContext,
+    tool_name: str,
+    title: str,
+    content: str,
+    is_draft: bool
+) -> Dict[str, Any]:
+    """Create a Webflow CMS item as a draft or published; shared by both tools"""
+    data, error = await _post_webflow(user_ctx, tool_name, {
+        "isArchived": False,
+        "isDraft": is_draft,
+        "fieldData": {
+            "name": title,
+            "slug": _webflow_slug(title),
+            "post-body": content
+        }
+    })
+    if error:
+        return error
+
+    return {
+        "success": True,
+        "platform": "webflow",
+        "status": "draft" if is_draft else "published",
+        "item_id": data.get("id"),
+        "title": title
+    }
 
-# =============================================================================
-# Webflow Integration
-# =============================================================================
 
 async def buzzposter_draft_webflow(
     user_ctx: UserContext,
@@ -691,47 +792,7 @@ async def buzzposter_draft_webflow(
     Returns:
         Dict with item info or error
     """
-    await check_rate_limit(user_ctx, "buzzposter_draft_webflow")
-    await check_feature_access(user_ctx, "integrations")
-
-    integration = await get_integration(user_ctx, "webflow")
-    if not integration:
-        return {"error": "Webflow not connected. Use buzzposter_connect_platform first."}
-
-    collection_id = integration.metadata.get("collection_id") if integration.metadata else None
-    if not collection_id:
-        return {"error": "Webflow collection ID not configured"}
-
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"https://api.webflow.com/v2/collections/{collection_id}/items",
-                headers={"Authorization": f"Bearer {integration.access_token}"},
-                json={
-                    "isArchived": False,
-                    "isDraft": True,
-                    "fieldData": {
-                        "name": title,
-                        "slug": title.lower().replace(" ", "-")[:100],
-                        "post-body": content
-                    }
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-
-        await log_usage(user_ctx, "buzzposter_draft_webflow")
-
-        return {
-            "success": True,
-            "platform": "webflow",
-            "status": "draft",
-            "item_id": data.get("id"),
-            "title": title
-        }
-
-    except httpx.HTTPError as e:
-        return {"error": f"Webflow API error: {str(e)}"}
+    return await _create_webflow_item(user_ctx, "buzzposter_draft_webflow", title, content, is_draft=True)
 
 
 async def buzzposter_publish_webflow(
@@ -750,52 +811,42 @@ async def buzzposter_publish_webflow(
     Returns:
         Dict with item info or error
     """
-    await check_rate_limit(user_ctx, "buzzposter_publish_webflow")
-    await check_feature_access(user_ctx, "integrations")
+    return await _create_webflow_item(user_ctx, "buzzposter_publish_webflow", title, content, is_draft=False)
 
-    integration = await get_integration(user_ctx, "webflow")
-    if not integration:
-        return {"error": "Webflow not connected. Use buzzposter_connect_platform first."}
 
-    collection_id = integration.metadata.get("collection_id") if integration.metadata else None
-    if not collection_id:
-        return {"error": "Webflow collection ID not configured"}
+# =============================================================================
+# Connection Management Tools
+# =============================================================================
 
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"https://api.webflow.com/v2/collections/{collection_id}/items",
-                headers={"Authorization": f"Bearer {integration.access_token}"},
-                json={
-                    "isArchived": False,
-                    "isDraft": False,
-                    "fieldData": {
-                        "name": title,
-                        "slug": title.lower().replace(" ", "-")[:100],
-                        "post-body": content
-                    }
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
+# Credentials each platform must supply, in the order platforms are listed to users
+_REQUIRED_CREDENTIALS: Dict[str, FrozenSet[str]] = {
+    "beehiiv": frozenset({"api_key", "publication_id"}),
+    "kit": frozenset({"api_key"}),
+    "mailchimp": frozenset({"api_key", "list_id"}),
+    "wordpress": frozenset({"site_url", "username", "app_password"}),
+    "ghost": frozenset({"site_url", "admin_api_key"}),
+    "webflow": frozenset({"api_token", "collection_id"}),
+}
+_VALID_PLATFORMS = frozenset(_REQUIRED_CREDENTIALS)
+_TOKEN_FIELDS = frozenset({"api_key", "api_token"})
 
-        await log_usage(user_ctx, "buzzposter_publish_webflow")
 
-        return {
-            "success": True,
-            "platform": "webflow",
-            "status": "published",
-            "item_id": data.get("id"),
-            "title": title
-        }
+def _token_credentials(credentials: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """API key/token platforms: the token is the secret, everything else is metadata"""
+    access_token = credentials.get("api_key") or credentials.get("api_token")
+    return access_token, {k: v for k, v in credentials.items() if k not in _TOKEN_FIELDS}
 
-    except httpx.HTTPError as e:
-        return {"error": f"Webflow API error: {str(e)}"}
 
+# platform -> credentials -> (access_token, metadata)
+_CREDENTIAL_BUILDERS: Dict[str, Callable[[Dict[str, Any]], Tuple[str, Dict[str, Any]]]] = {
+    "beehiiv": _token_credentials,
+    "kit": _token_credentials,
+    "mailchimp": _token_credentials,
+    "webflow": _token_credentials,
+    "wordpress": lambda c: (c["app_password"], {"site_url": c["site_url"], "username": c["username"]}),
+    "ghost": lambda c: (c["admin_api_key"], {"site_url": c["site_url"]}),
+}
 
-# =============================================================================
-# Connection Management Tools
-# =============================================================================
 
 async def buzzposter_connect_platform(
     user_ctx: UserContext,
@@ -813,41 +864,23 @@ async def buzzposter_connect_platform(
     Returns:
         Dict with success status or error
     """
-    await check_rate_limit(user_ctx, "buzzposter_connect_platform")
     await check_feature_access(user_ctx, "integrations")
+    await check_rate_limit(user_ctx, "buzzposter_connect_platform")
 
-    valid_platforms = ["beehiiv", "kit", "mailchimp", "wordpress", "ghost", "webflow"]
-    if platform not in valid_platforms:
-        return {"error": f"Invalid platform. Must be one of: {', '.join(valid_platforms)}"}
+    if platform not in _VALID_PLATFORMS:
+        return {"error": f"Invalid platform. Must be one of: {', '.join(_REQUIRED_CREDENTIALS)}"}
 
     # Validate required credentials per platform
-    required_fields = {
-        "beehiiv": ["api_key", "publication_id"],
-        "kit": ["api_key"],
-        "mailchimp": ["api_key", "list_id"],
-        "wordpress": ["site_url", "username", "app_password"],
-        "ghost": ["site_url", "admin_api_key"],
-        "webflow": ["api_token", "collection_id"]
-    }
-
-    for field in required_fields.get(platform, []):
-        if field not in credentials:
-            return {"error": f"Missing required field: {field}"}
+    missing = _REQUIRED_CREDENTIALS[platform] - credentials.keys()
+    if missing:
+        return {"error": f"Missing required field: {', '.join(sorted(missing))}"}
 
     try:
         # Check if integration already exists
-        existing = await get_integration(user_ctx, platform)
+        existing = await _load_integration(user_ctx, platform)
 
         # Prepare integration data
-        if platform in ["beehiiv", "kit", "mailchimp", "webflow"]:
-            access_token = credentials.get("api_key") or credentials.get("api_token")
-            metadata = {k: v for k, v in credentials.items() if k not in ["api_key", "api_token"]}
-        elif platform == "wordpress":
-            access_token = credentials["app_password"]
-            metadata = {"site_url": credentials["site_url"], "username": credentials["username"]}
-        elif platform == "ghost":
-            access_token = credentials["admin_api_key"]
-            metadata = {"site_url": credentials["site_url"]}
+        access_token, metadata = _CREDENTIAL_BUILDERS[platform](credentials)
 
         if existing:
             # Update existing integration
@@ -865,6 +898,7 @@ async def buzzposter_connect_platform(
             user_ctx.db.add(integration)
 
         await user_ctx.db.commit()
+        invalidate_integration(user_ctx.user.id, platform)
         await log_usage(user_ctx, "buzzposter_connect_platform")
 
         return {
@@ -891,20 +925,25 @@ async def buzzposter_list_integrations(user_ctx: UserContext) -> Dict[str, Any]:
     await check_rate_limit(user_ctx, "buzzposter_list_integrations")
 
     try:
-        stmt = select(UserIntegration).where(UserIntegration.user_id == user_ctx.user.id)
+        # Only the columns we return; credentials never leave the database
+        stmt = select(
+            UserIntegration.platform,
+            UserIntegration.created_at,
+            UserIntegration.metadata
+        ).where(UserIntegration.user_id == user_ctx.user.id)
         result = await user_ctx.db.execute(stmt)
-        integrations = result.scalars().all()
+        integrations = result.all()
 
         await log_usage(user_ctx, "buzzposter_list_integrations")
 
         return {
             "integrations": [
                 {
-                    "platform": i.platform,
-                    "connected_at": i.created_at.isoformat(),
-                    "metadata": i.metadata
+                    "platform": platform,
+                    "connected_at": created_at.isoformat(),
+                    "metadata": metadata
                 }
-                for i in integrations
+                for platform, created_at, metadata in integrations
             ],
             "total": len(integrations)
         }
@@ -3,18 +3,25 @@ Cloudflare R2 media upload and management tools
 """
 import os
 import io
+import time
 import base64
+import asyncio
+import binascii
 import hashlib
 import mimetypes
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 import boto3
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from botocore.exceptions import ClientError
-from sqlalchemy import select, func
+from sqlalchemy import select, delete, func, update, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from ..auth.middleware import UserContext, check_rate_limit, check_feature_access, log_usage
-from ..db.models import Media
+from ..db.models import Media, UserStorageStats
+from .social import buzzposter_post
 
 
 # R2 Configuration
@@ -24,35 +31,169 @@ R2_SECRET_ACCESS_KEY = os.getenv("R2_SECRET_ACCESS_KEY")
 R2_BUCKET_NAME = os.getenv("R2_BUCKET_NAME")
 R2_PUBLIC_URL = os.getenv("R2_PUBLIC_URL", "")
 
+class _TierTable(dict):
+    """Per-tier settings; unknown tiers get the free tier's entry"""
+    def __missing__(self, tier: str) -> Any:
+        return self["free"]
+
+
 # Tier storage limits
-TIER_STORAGE_LIMITS = {
+TIER_STORAGE_LIMITS = _TierTable({
     "free": {"max_storage_bytes": 0, "max_file_bytes": 0},
     "pro": {"max_storage_bytes": 1_073_741_824, "max_file_bytes": 10_485_760},      # 1GB, 10MB
     "business": {"max_storage_bytes": 10_737_418_240, "max_file_bytes": 104_857_600}  # 10GB, 100MB
-}
+})
+
+BYTES_PER_MB = 1_048_576
+
+# Tier limits in MB as reported by buzzposter_get_storage_usage
+TIER_LIMITS_MB = _TierTable({
+    tier: {
+        "limit_mb": round(limits["max_storage_bytes"] / BYTES_PER_MB, 2),
+        "max_file_mb": round(limits["max_file_bytes"] / BYTES_PER_MB, 2),
+    }
+    for tier, limits in TIER_STORAGE_LIMITS.items()
+})
+
+# Base64 is decoded in slices of this many characters (a multiple of 4)
+BASE64_CHUNK_CHARS = 4 * 256 * 1024
+
+# Payloads longer than this are decoded off the event loop
+OFFLOAD_DECODE_CHARS = 1_048_576
+
+# Uploads above the threshold go to R2 as parallel multipart uploads of
+# 8MB parts; smaller files are sent with a single PUT
+UPLOAD_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4,
+    use_threads=True,
+)
+
+# Created lazily by _get_r2_client
+_r2_client = None
+
+# Page size cap for buzzposter_list_media
+MAX_LIST_MEDIA_LIMIT = 200
 
 # Allowed MIME types
-ALLOWED_MIME_TYPES = {
+ALLOWED_MIME_TYPES = frozenset({
     "image/jpeg", "image/jpg", "image/png", "image/gif",
     "image/webp", "image/svg+xml", "video/mp4", "video/webm"
-}
+})
 
 
 def _get_r2_client():
-    """Initialize and return boto3 S3 client configured for Cloudflare R2"""
+    """
+    Return the shared boto3 S3 client configured for Cloudflare R2.
+    Built on first use; boto3 clients are thread-safe, so worker threads share it.
+    """
+    global _r2_client
+    if _r2_client is not None:
+        return _r2_client
+
     if not all([R2_ACCOUNT_ID, R2_ACCESS_KEY_ID, R2_SECRET_ACCESS_KEY, R2_BUCKET_NAME]):
         raise ValueError("R2 configuration incomplete. Check environment variables.")
 
     endpoint_url = f"https://{R2_ACCOUNT_ID}.r2.cloudflarestorage.com"
 
-    s3_client = boto3.client(
+    _r2_client = boto3.client(
         "s3",
         endpoint_url=endpoint_url,
         aws_access_key_id=R2_ACCESS_KEY_ID,
         aws_secret_access_key=R2_SECRET_ACCESS_KEY,
-        config=Config(signature_version="s3v4"),
+        config=Config(
+            signature_version="s3v4",
+            max_pool_connections=50,
+            # boto retries throttling and transient errors itself
+            retries={"mode": "standard", "max_attempts": 3},
+        ),
+    )
+    return _r2_client
+
+
+async def _delete_r2_object(r2_key: str) -> None:
+    """Delete an object from R2 in a worker thread"""
+    s3_client = _get_r2_client()
+    await asyncio.to_thread(s3_client.delete_object, Bucket=R2_BUCKET_NAME, Key=r2_key)
+
+
+def _key_timestamp() -> str:
+    """
+    Nanosecond upload time as 13 base32hex chars for R2 keys.
+    Sorts in time order and avoids strftime on every upload.
+    """
+    return base64.b32hexencode(time.time_ns().to_bytes(8, "big")).decode("ascii").rstrip("=")
+
+
+def _base64_decoded_size(file_data: str) -> int:
+    """Decoded size of base64 data without decoding it (exact for well-formed input)"""
+    chars = len(file_data) - file_data.count("\n") - file_data.count("\r") - file_data.count(" ")
+    padding = file_data.rstrip()[-2:].count("=")
+    return max(chars * 3 // 4 - padding, 0)
+
+
+def _decode_base64(file_data: str) -> Tuple[io.BytesIO, str]:
+    """
+    Decode base64 upload data slice by slice into a buffer, hashing as it goes.
+    Returns (buffer positioned at the end, short hex digest for the R2 key).
+    Raises binascii.Error on invalid data.
+    """
+    if "\n" in file_data or "\r" in file_data or " " in file_data:
+        # Line-wrapped input; slices must line up with 4-char groups
+        file_data = "".join(file_data.split())
+
+    buf = io.BytesIO()
+    digest = hashlib.sha256()
+    for start in range(0, len(file_data), BASE64_CHUNK_CHARS):
+        chunk = binascii.a2b_base64(file_data[start:start + BASE64_CHUNK_CHARS])
+        digest.update(chunk)
+        buf.write(chunk)
+
+    # SHA-256 runs on OpenSSL's hardware-accelerated path; only the first
+    # 8 hex chars are used, matching the existing key format
+    return buf, digest.hexdigest()[:8]
+
+
+async def _get_storage_stats(user_ctx: UserContext) -> Tuple[int, int]:
+    """
+    Get (total_bytes, file_count) for the user's media from the stats row.
+    Users without a row yet are seeded once from their existing media.
+    """
+    stmt = select(UserStorageStats.total_bytes, UserStorageStats.file_count).where(
+        UserStorageStats.user_id == user_ctx.user.id
+    )
+    result = await user_ctx.db.execute(stmt)
+    row = result.one_or_none()
+    if row:
+        return row.total_bytes, row.file_count
+
+    stmt = select(
+        func.coalesce(func.sum(Media.size_bytes), 0),
+        func.count(Media.id)
+    ).where(Media.user_id == user_ctx.user.id)
+    result = await user_ctx.db.execute(stmt)
+    total_bytes, file_count = result.one()
+
+    await user_ctx.db.execute(
+        pg_insert(UserStorageStats)
+        .values(user_id=user_ctx.user.id, total_bytes=total_bytes, file_count=file_count)
+        .on_conflict_do_nothing(index_elements=[UserStorageStats.user_id])
+    )
+    await user_ctx.db.commit()
+    return total_bytes, file_count
+
+
+async def _update_storage_stats(user_ctx: UserContext, delta_bytes: int, delta_files: int) -> None:
+    """Apply a media insert/delete to the stats row; committed with the caller's transaction"""
+    await user_ctx.db.execute(
+        update(UserStorageStats)
+        .where(UserStorageStats.user_id == user_ctx.user.id)
+        .values(
+            total_bytes=UserStorageStats.total_bytes + delta_bytes,
+            file_count=UserStorageStats.file_count + delta_files
+        )
     )
-    return s3_client
 
 
 async def _validate_file_access(user_ctx: UserContext, file_size: int) -> Dict[str, Any]:
@@ -70,22 +211,20 @@ async def _validate_file_access(user_ctx: UserContext, file_size: int) -> Dict[s
     await check_feature_access(user_ctx, "media_upload")
 
     # Get tier limits
-    limits = TIER_STORAGE_LIMITS.get(user_ctx.tier, TIER_STORAGE_LIMITS["free"])
+    limits = TIER_STORAGE_LIMITS[user_ctx.tier]
 
     # Check file size limit
     if file_size > limits["max_file_bytes"]:
         return {
-            "error": f"File too large for {user_ctx.tier} tier. Max: {limits['max_file_bytes'] / 1_048_576:.1f}MB"
+            "error": f"File too large for {user_ctx.tier} tier. Max: {limits['max_file_bytes'] / BYTES_PER_MB:.1f}MB"
         }
 
     # Check total storage usage
-    stmt = select(func.sum(Media.size_bytes)).where(Media.user_id == user_ctx.user.id)
-    result = await user_ctx.db.execute(stmt)
-    total_usage = result.scalar() or 0
+    total_usage, _ = await _get_storage_stats(user_ctx)
 
     if total_usage + file_size > limits["max_storage_bytes"]:
         return {
-            "error": f"Storage limit reached. Used: {total_usage / 1_048_576:.1f}MB, Limit: {limits['max_storage_bytes'] / 1_048_576:.1f}MB. Delete files or upgrade tier."
+            "error": f"Storage limit reached. Used: {total_usage / BYTES_PER_MB:.1f}MB, Limit: {limits['max_storage_bytes'] / BYTES_PER_MB:.1f}MB. Delete files or upgrade tier."
         }
 
     return {"valid": True}
@@ -113,19 +252,6 @@ async def buzzposter_upload_media(
     await check_rate_limit(user_ctx, "buzzposter_upload_media")
 
     try:
-        # Decode base64 data
-        try:
-            file_bytes = base64.b64decode(file_data)
-        except Exception as e:
-            return {"error": f"Invalid base64 data: {str(e)}"}
-
-        file_size = len(file_bytes)
-
-        # Validate access and quotas
-        validation = await _validate_file_access(user_ctx, file_size)
-        if "error" in validation:
-            return validation
-
         # Determine content type
         if not content_type:
             content_type, _ = mimetypes.guess_type(filename)
@@ -138,29 +264,43 @@ async def buzzposter_upload_media(
                 "error": f"File type not supported: {content_type}. Allowed types: {', '.join(ALLOWED_MIME_TYPES)}"
             }
 
+        # Validate access and quotas before paying for the decode; valid
+        # base64 never decodes to more than this size
+        validation = await _validate_file_access(user_ctx, _base64_decoded_size(file_data))
+        if "error" in validation:
+            return validation
+
+        # Decode base64 data without holding a second full copy. Large
+        # payloads are decoded and hashed in a worker thread so the event
+        # loop keeps serving other requests
+        try:
+            if len(file_data) > OFFLOAD_DECODE_CHARS:
+                file_buf, file_hash = await asyncio.to_thread(_decode_base64, file_data)
+            else:
+                file_buf, file_hash = _decode_base64(file_data)
+        except Exception as e:
+            return {"error": f"Invalid base64 data: {str(e)}"}
+
+        file_size = file_buf.tell()
+
         # Generate unique R2 key
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        file_hash = hashlib.md5(file_bytes).hexdigest()[:8]
-        r2_key = f"{user_ctx.user.id}/{timestamp}_{file_hash}_{filename}"
+        r2_key = f"{user_ctx.user.id}/{_key_timestamp()}_{file_hash}_{filename}"
 
-        # Upload to R2
+        # Upload to R2 (retries are handled by the client's retry config)
         s3_client = _get_r2_client()
-        max_retries = 3
-        last_error = None
-
-        for attempt in range(max_retries):
-            try:
-                s3_client.put_object(
-                    Bucket=R2_BUCKET_NAME,
-                    Key=r2_key,
-                    Body=file_bytes,
-                    ContentType=content_type
-                )
-                break  # Success
-            except ClientError as e:
-                last_error = e
-                if attempt == max_retries - 1:
-                    return {"error": f"R2 upload failed after {max_retries} attempts: {str(e)}"}
+        try:
+            file_buf.seek(0)
+            # boto3 is blocking; run it off the event loop
+            await asyncio.to_thread(
+                s3_client.upload_fileobj,
+                file_buf,
+                R2_BUCKET_NAME,
+                r2_key,
+                ExtraArgs={"ContentType": content_type},
+                Config=UPLOAD_TRANSFER_CONFIG
+            )
+        except (ClientError, S3UploadFailedError) as e:
+            return {"error": f"R2 upload failed: {str(e)}"}
 
         # Generate public URL
         public_url = f"{R2_PUBLIC_URL.rstrip('/')}/{r2_key}" if R2_PUBLIC_URL else f"https://{R2_BUCKET_NAME}.r2.dev/{r2_key}"
@@ -175,6 +315,7 @@ async def buzzposter_upload_media(
             size_bytes=file_size
         )
         user_ctx.db.add(media)
+        await _update_storage_stats(user_ctx, file_size, 1)
         await user_ctx.db.commit()
         await user_ctx.db.refresh(media)
 
@@ -193,35 +334,55 @@ async def buzzposter_upload_media(
         # Attempt cleanup if database save failed but R2 upload succeeded
         try:
             if 'r2_key' in locals():
-                s3_client = _get_r2_client()
-                s3_client.delete_object(Bucket=R2_BUCKET_NAME, Key=r2_key)
+                await _delete_r2_object(r2_key)
         except:
             pass  # Cleanup failed, log it but don't mask original error
 
         return {"error": f"Upload failed: {str(e)}"}
 
 
-async def buzzposter_list_media(user_ctx: UserContext) -> Dict[str, Any]:
+async def buzzposter_list_media(
+    user_ctx: UserContext,
+    limit: int = 50,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
     """
-    List all media files uploaded by the user
+    List media files uploaded by the user, newest first, one page at a time
 
     Args:
         user_ctx: User context with auth and db
+        limit: Number of files to return (default 50, max 200)
+        cursor: next_cursor from the previous page
 
     Returns:
-        Dict with media list
+        Dict with media list and next_cursor (None on the last page)
     """
     await check_rate_limit(user_ctx, "buzzposter_list_media")
 
+    limit = max(1, min(limit, MAX_LIST_MEDIA_LIMIT))
+
     try:
-        # Query user's media
-        stmt = select(Media).where(Media.user_id == user_ctx.user.id).order_by(Media.created_at.desc())
+        # Keyset pagination on (created_at, id), served by ix_media_user_created
+        stmt = select(Media).where(Media.user_id == user_ctx.user.id)
+        if cursor:
+            try:
+                created_at, _, media_id = cursor.rpartition("_")
+                position = (datetime.fromisoformat(created_at), int(media_id))
+            except ValueError:
+                return {"error": "Invalid cursor"}
+            stmt = stmt.where(tuple_(Media.created_at, Media.id) < position)
+        stmt = stmt.order_by(Media.created_at.desc(), Media.id.desc()).limit(limit + 1)
         result = await user_ctx.db.execute(stmt)
         media_files = result.scalars().all()
 
-        # Calculate total usage
-        total_usage = sum(m.size_bytes for m in media_files)
-        tier_limit = TIER_STORAGE_LIMITS.get(user_ctx.tier, TIER_STORAGE_LIMITS["free"])["max_storage_bytes"]
+        next_cursor = None
+        if len(media_files) > limit:
+            media_files = media_files[:limit]
+            last = media_files[-1]
+            next_cursor = f"{last.created_at.isoformat()}_{last.id}"
+
+        total_usage, total_files = await _get_storage_stats(user_ctx)
+        tier_limit = TIER_STORAGE_LIMITS[user_ctx.tier]["max_storage_bytes"]
 
         await log_usage(user_ctx, "buzzposter_list_media")
 
@@ -237,7 +398,8 @@ async def buzzposter_list_media(user_ctx: UserContext) -> Dict[str, Any]:
                 }
                 for m in media_files
             ],
-            "total_files": len(media_files),
+            "next_cursor": next_cursor,
+            "total_files": total_files,
             "total_usage_bytes": total_usage,
             "tier_limit_bytes": tier_limit,
             "usage_percentage": (total_usage / tier_limit * 100) if tier_limit > 0 else 0
@@ -261,33 +423,39 @@ async def buzzposter_delete_media(user_ctx: UserContext, media_id: int) -> Dict[
     await check_rate_limit(user_ctx, "buzzposter_delete_media")
 
     try:
-        # Find media and verify ownership
-        stmt = select(Media).where(Media.id == media_id, Media.user_id == user_ctx.user.id)
+        # Delete the row, verifying ownership, in a single round trip
+        stmt = (
+            delete(Media)
+            .where(Media.id == media_id, Media.user_id == user_ctx.user.id)
+            .returning(Media.r2_key, Media.filename, Media.size_bytes)
+        )
         result = await user_ctx.db.execute(stmt)
-        media = result.scalar_one_or_none()
+        media = result.first()
 
         if not media:
             return {"error": "Media file not found or access denied"}
 
-        # Delete from R2
-        try:
-            s3_client = _get_r2_client()
-            s3_client.delete_object(Bucket=R2_BUCKET_NAME, Key=media.r2_key)
-        except ClientError as e:
-            # Continue even if R2 deletion fails (orphaned file)
-            pass
+        # Surface missing R2 configuration before anything is committed
+        _get_r2_client()
 
-        # Delete from database
-        await user_ctx.db.delete(media)
+        await _update_storage_stats(user_ctx, -media.size_bytes, -1)
         await user_ctx.db.commit()
 
-        await log_usage(user_ctx, "buzzposter_delete_media")
-
-        return {
+        # Remove the object only once the row is gone, so a failed commit
+        # never leaves a row pointing at a deleted object
+        response = {
             "success": True,
             "message": f"Deleted {media.filename}",
             "media_id": media_id
         }
+        try:
+            await _delete_r2_object(media.r2_key)
+        except ClientError as e:
+            response["warning"] = f"File removed from your library but R2 cleanup failed: {str(e)}"
+
+        await log_usage(user_ctx, "buzzposter_delete_media")
+
+        return response
 
     except Exception as e:
         return {"error": f"Failed to delete media: {str(e)}"}
@@ -306,16 +474,9 @@ async def buzzposter_get_storage_usage(user_ctx: UserContext) -> Dict[str, Any]:
     await check_rate_limit(user_ctx, "buzzposter_get_storage_usage")
 
     try:
-        # Query total usage
-        stmt = select(
-            func.count(Media.id),
-            func.sum(Media.size_bytes)
-        ).where(Media.user_id == user_ctx.user.id)
-        result = await user_ctx.db.execute(stmt)
-        count, total_bytes = result.one()
-
-        total_bytes = total_bytes or 0
-        tier_limits = TIER_STORAGE_LIMITS.get(user_ctx.tier, TIER_STORAGE_LIMITS["free"])
+        total_bytes, count = await _get_storage_stats(user_ctx)
+        tier_limits = TIER_STORAGE_LIMITS[user_ctx.tier]
+        tier_limits_mb = TIER_LIMITS_MB[user_ctx.tier]
 
         await log_usage(user_ctx, "buzzposter_get_storage_usage")
 
@@ -323,11 +484,11 @@ async def buzzposter_get_storage_usage(user_ctx: UserContext) -> Dict[str, Any]:
             "tier": user_ctx.tier,
             "total_files": count,
             "used_bytes": total_bytes,
-            "used_mb": round(total_bytes / 1_048_576, 2),
+            "used_mb": round(total_bytes / BYTES_PER_MB, 2),
             "limit_bytes": tier_limits["max_storage_bytes"],
-            "limit_mb": round(tier_limits["max_storage_bytes"] / 1_048_576, 2),
+            "limit_mb": tier_limits_mb["limit_mb"],
             "max_file_bytes": tier_limits["max_file_bytes"],
-            "max_file_mb": round(tier_limits["max_file_bytes"] / 1_048_576, 2),
+            "max_file_mb": tier_limits_mb["max_file_mb"],
             "usage_percentage": round((total_bytes / tier_limits["max_storage_bytes"] * 100), 2) if tier_limits["max_storage_bytes"] > 0 else 0
         }
 
@@ -370,9 +531,6 @@ async def buzzposter_post_with_media(
                 return upload_result
             media_url = upload_result["url"]
 
-        # Import here to avoid circular dependency
-        from .social import buzzposter_post
-
         # Post to social media
         post_args = {
             "platform": platform,
@@ -1,11 +1,85 @@
 """
 User profile and feed management tools
 """
-from typing import List, Dict, Any, Optional
-from sqlalchemy import select
-from ..db.models import UserFeed, UserProfile
+import heapq
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Tuple
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from ..db.models import User, UserFeed, UserProfile
 from ..auth.middleware import UserContext, check_rate_limit, check_feature_access, log_usage
-from .feeds import buzzposter_get_feed
+from ..http_client import DEFAULT_TIMEOUT
+from .feeds import BUILT_IN_FEEDS, TOPIC_FEED_TIMEOUT, _article_key, _fetch_many_feeds, _probe_feed
+
+
+# Upper bound on concurrent feed fetches for one buzzposter_my_feed call
+MY_FEED_CONCURRENCY = 8
+
+# Number of articles returned by buzzposter_my_feed
+MY_FEED_LIMIT = 50
+
+
+async def _get_profile(user_ctx: UserContext) -> Optional[UserProfile]:
+    """Get the user's profile, memoized on the request context"""
+    if "profile" not in user_ctx.cache:
+        # lambda_stmt caches the compiled statement; only user_id is rebound.
+        # The other per-user lookups in this module do the same
+        user_id = user_ctx.user.id
+        result = await user_ctx.db.execute(
+            lambda_stmt(lambda: select(UserProfile).where(UserProfile.user_id == user_id))
+        )
+        user_ctx.cache["profile"] = result.scalar_one_or_none()
+    return user_ctx.cache["profile"]
+
+
+async def _get_feeds(user_ctx: UserContext) -> List[Any]:
+    """
+    Get the user's custom feeds as (id, feed_name, feed_url, topic, created_at)
+    rows, memoized on the request context
+    """
+    if "feeds" not in user_ctx.cache:
+        # Plain column rows; no ORM instances to hydrate and track
+        user_id = user_ctx.user.id
+        result = await user_ctx.db.execute(lambda_stmt(lambda:
+            select(
+                UserFeed.id,
+                UserFeed.feed_name,
+                UserFeed.feed_url,
+                UserFeed.topic,
+                UserFeed.created_at,
+            ).where(UserFeed.user_id == user_id)
+        ))
+        user_ctx.cache["feeds"] = result.all()
+    return user_ctx.cache["feeds"]
+
+
+async def _get_feed_sources(user_ctx: UserContext) -> Tuple[List[str], List[Tuple[str, str]]]:
+    """
+    Get (profile topics, [(feed_name, feed_url)]) for buzzposter_my_feed,
+    memoized on the request context
+    """
+    if "feed_sources" not in user_ctx.cache:
+        # One round trip: one row per feed (or a single row with no feed),
+        # each carrying the profile's topics
+        user_id = user_ctx.user.id
+        result = await user_ctx.db.execute(lambda_stmt(lambda:
+            select(UserProfile.topics, UserFeed.feed_name, UserFeed.feed_url)
+            .select_from(User)
+            .outerjoin(UserProfile, UserProfile.user_id == User.id)
+            .outerjoin(UserFeed, UserFeed.user_id == User.id)
+            .where(User.id == user_id)
+        ))
+        rows = result.all()
+        topics = (rows[0].topics if rows else None) or []
+        custom_feeds = [(row.feed_name, row.feed_url) for row in rows if row.feed_url is not None]
+        user_ctx.cache["feed_sources"] = (topics, custom_feeds)
+    return user_ctx.cache["feed_sources"]
+
+
+def _invalidate_feeds(user_ctx: UserContext) -> None:
+    """Drop memoized lookups that depend on the user's feeds"""
+    user_ctx.cache.pop("feeds", None)
+    user_ctx.cache.pop("feed_sources", None)
 
 
 async def buzzposter_add_feed(
@@ -30,32 +104,31 @@ async def buzzposter_add_feed(
     await check_rate_limit(user_ctx, "buzzposter_add_feed")
     await check_feature_access(user_ctx, "custom_feeds")
 
-    # Verify feed is valid by attempting to fetch it
-    test_result = await buzzposter_get_feed(user_ctx, feed_url)
-    if "error" in test_result:
-        return {"error": f"Invalid feed URL: {test_result['error']}"}
+    # Verify feed is valid by reading just the start of it
+    probe_error = await _probe_feed(feed_url, DEFAULT_TIMEOUT)
+    if probe_error:
+        return {"error": f"Invalid feed URL: {probe_error}"}
 
-    # Check if feed already exists for this user
+    # Add feed; the unique (user_id, feed_url) index turns a duplicate into
+    # a no-op with no returned row
     result = await user_ctx.db.execute(
-        select(UserFeed).where(
-            UserFeed.user_id == user_ctx.user.id,
-            UserFeed.feed_url == feed_url
+        pg_insert(UserFeed)
+        .values(
+            user_id=user_ctx.user.id,
+            feed_url=feed_url,
+            feed_name=feed_name,
+            topic=topic,
         )
+        .on_conflict_do_nothing(index_elements=["user_id", "feed_url"])
+        .returning(UserFeed.id)
     )
-    existing_feed = result.scalar_one_or_none()
+    feed_id = result.scalar_one_or_none()
 
-    if existing_feed:
+    if feed_id is None:
         return {"error": "Feed already exists in your collection"}
 
-    # Add feed
-    user_feed = UserFeed(
-        user_id=user_ctx.user.id,
-        feed_url=feed_url,
-        feed_name=feed_name,
-        topic=topic,
-    )
-    user_ctx.db.add(user_feed)
     await user_ctx.db.commit()
+    _invalidate_feeds(user_ctx)
 
     await log_usage(user_ctx, "buzzposter_add_feed")
 
@@ -63,7 +136,7 @@ async def buzzposter_add_feed(
         "success": True,
         "message": f"Added feed: {feed_name}",
         "feed": {
-            "id": user_feed.id,
+            "id": feed_id,
             "name": feed_name,
             "url": feed_url,
             "topic": topic,
@@ -85,12 +158,13 @@ async def buzzposter_remove_feed(user_ctx: UserContext, feed_id: int) -> Dict[st
     await check_rate_limit(user_ctx, "buzzposter_remove_feed")
 
     # Find feed
-    result = await user_ctx.db.execute(
+    user_id = user_ctx.user.id
+    result = await user_ctx.db.execute(lambda_stmt(lambda:
         select(UserFeed).where(
             UserFeed.id == feed_id,
-            UserFeed.user_id == user_ctx.user.id
+            UserFeed.user_id == user_id
         )
-    )
+    ))
     feed = result.scalar_one_or_none()
 
     if not feed:
@@ -99,6 +173,7 @@ async def buzzposter_remove_feed(user_ctx: UserContext, feed_id: int) -> Dict[st
     # Delete feed
     await user_ctx.db.delete(feed)
     await user_ctx.db.commit()
+    _invalidate_feeds(user_ctx)
 
     await log_usage(user_ctx, "buzzposter_remove_feed")
 
@@ -121,20 +196,18 @@ async def buzzposter_list_feeds(user_ctx: UserContext) -> Dict[str, Any]:
     await check_rate_limit(user_ctx, "buzzposter_list_feeds")
 
     # Get all feeds for user
-    result = await user_ctx.db.execute(
-        select(UserFeed).where(UserFeed.user_id == user_ctx.user.id)
-    )
-    feeds = result.scalars().all()
-
-    feed_list = []
-    for feed in feeds:
-        feed_list.append({
-            "id": feed.id,
-            "name": feed.feed_name,
-            "url": feed.feed_url,
-            "topic": feed.topic,
-            "created_at": feed.created_at.isoformat(),
-        })
+    feeds = await _get_feeds(user_ctx)
+
+    feed_list = [
+        {
+            "id": feed_id,
+            "name": feed_name,
+            "url": feed_url,
+            "topic": topic,
+            "created_at": created_at.isoformat(),
+        }
+        for feed_id, feed_name, feed_url, topic, created_at in feeds
+    ]
 
     await log_usage(user_ctx, "buzzposter_list_feeds")
 
@@ -165,14 +238,12 @@ async def buzzposter_set_profile(
     await check_rate_limit(user_ctx, "buzzposter_set_profile")
 
     # Get or create profile
-    result = await user_ctx.db.execute(
-        select(UserProfile).where(UserProfile.user_id == user_ctx.user.id)
-    )
-    profile = result.scalar_one_or_none()
+    profile = await _get_profile(user_ctx)
 
     if not profile:
         profile = UserProfile(user_id=user_ctx.user.id)
         user_ctx.db.add(profile)
+        user_ctx.cache["profile"] = profile
 
     # Update profile fields
     if topics is not None:
@@ -183,6 +254,7 @@ async def buzzposter_set_profile(
         profile.description = description
 
     await user_ctx.db.commit()
+    user_ctx.cache.pop("feed_sources", None)
     await log_usage(user_ctx, "buzzposter_set_profile")
 
     return {
@@ -207,47 +279,49 @@ async def buzzposter_my_feed(user_ctx: UserContext) -> Dict[str, Any]:
     """
     await check_rate_limit(user_ctx, "buzzposter_my_feed")
 
-    # Get user profile
-    result = await user_ctx.db.execute(
-        select(UserProfile).where(UserProfile.user_id == user_ctx.user.id)
-    )
-    profile = result.scalar_one_or_none()
-
-    # Get user's custom feeds
-    result = await user_ctx.db.execute(
-        select(UserFeed).where(UserFeed.user_id == user_ctx.user.id)
+    topics, custom_feeds = await _get_feed_sources(user_ctx)
+
+    # (source name, url, timeout) for every profile topic feed and custom feed
+    sources = []
+    for topic in topics:
+        for feed_info in BUILT_IN_FEEDS.get(topic.lower(), ()):
+            sources.append((feed_info["name"], feed_info["url"], TOPIC_FEED_TIMEOUT))
+    for feed_name, feed_url in custom_feeds:
+        sources.append((feed_name, feed_url, DEFAULT_TIMEOUT))
+
+    # Fetch all feeds concurrently. Fetches do no database work, so they can
+    # overlap; MY_FEED_CONCURRENCY bounds how many are in flight
+    results = await _fetch_many_feeds(
+        [(url, timeout) for _, url, timeout in sources],
+        concurrency=MY_FEED_CONCURRENCY,
     )
-    custom_feeds = result.scalars().all()
 
+    # A failing feed is skipped. Topic and custom feeds often overlap, so
+    # keep only the first copy of each article
     all_articles = []
-
-    # Fetch articles from profile topics
-    if profile and profile.topics:
-        from .feeds import buzzposter_get_topic
-        for topic in profile.topics:
-            result = await buzzposter_get_topic(user_ctx, topic)
-            if "articles" in result:
-                all_articles.extend(result["articles"])
-
-    # Fetch articles from custom feeds
-    for feed in custom_feeds:
-        result = await buzzposter_get_feed(user_ctx, feed.feed_url)
+    seen = set()
+    for (source, _, _), result in zip(sources, results):
         if "articles" in result:
             for article in result["articles"]:
-                article["source"] = feed.feed_name
-            all_articles.extend(result["articles"])
-
-    # Sort by published date
-    all_articles.sort(
-        key=lambda x: x.get("published", ""),
-        reverse=True
-    )
+                link = article["link"]
+                if link:
+                    key = _article_key(link)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                article["source"] = source
+                all_articles.append(article)
+
+    # Top 50 by published date; a bounded heap instead of sorting everything.
+    # published_ts is the epoch int parsed at fetch time, so RSS and Atom
+    # dates order correctly against each other
+    top_articles = heapq.nlargest(MY_FEED_LIMIT, all_articles, key=itemgetter("published_ts"))
 
     await log_usage(user_ctx, "buzzposter_my_feed")
 
     return {
-        "articles": all_articles[:50],  # Top 50 articles
+        "articles": top_articles,
         "total": len(all_articles),
-        "profile_topics": profile.topics if profile else [],
+        "profile_topics": topics,
         "custom_feeds": len(custom_feeds),
     }
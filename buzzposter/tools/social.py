@@ -1,14 +1,34 @@
 """
 Late.dev social media posting tools
 """
+import time
+import asyncio
 import httpx
+import orjson
+import weakref
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from sqlalchemy import select
+from ..auth.late_oauth import (
+    LATE_GET_CACHE,
+    LATE_GET_CACHE_SIZE,
+    LATE_GET_CACHE_TTL,
+    invalidate_late_cache,
+    refresh_access_token,
+    save_tokens,
+)
 from ..auth.middleware import UserContext, check_rate_limit, check_feature_access, log_usage
+from ..db.models import User
+from ..http_client import get_http_client
 
 
 LATE_API_BASE = "https://getlate.dev/api/v1"
 
+# user_id -> lock held while refreshing that user's Late.dev token, so
+# concurrent 401s trigger a single refresh. Weak values: an entry goes away
+# once no caller holds or waits on its lock
+_REFRESH_LOCKS: "weakref.WeakValueDictionary[int, asyncio.Lock]" = weakref.WeakValueDictionary()
+
 
 async def _make_late_request(
     user_ctx: UserContext,
@@ -19,53 +39,116 @@ async def _make_late_request(
 ) -> Dict[str, Any]:
     """
     Make authenticated request to Late.dev API
-    Handles token refresh if needed
+    Handles token refresh if needed. Successful GETs are cached for
+    LATE_GET_CACHE_TTL seconds per user; a successful POST drops the
+    user's cached posts* responses, and save_tokens drops all of them.
     """
     if not user_ctx.late_token:
         return {"error": "Late.dev account not connected. Please connect via /auth/late/connect"}
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.request(
-                method,
-                f"{LATE_API_BASE}/{endpoint}",
-                headers={"Authorization": f"Bearer {user_ctx.late_token}"},
-                json=json_data,
-                params=params,
+    if method == "GET":
+        cache_key = (user_ctx.user.id, endpoint, tuple(sorted((params or {}).items())))
+        cached = LATE_GET_CACHE.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+    result = await _send_late_request(user_ctx, method, endpoint, json_data, params)
+
+    if "error" not in result:
+        if method == "GET":
+            LATE_GET_CACHE.pop(cache_key, None)
+            if len(LATE_GET_CACHE) >= LATE_GET_CACHE_SIZE:
+                # Drop the oldest entry (dicts keep insertion order)
+                LATE_GET_CACHE.pop(next(iter(LATE_GET_CACHE)))
+            LATE_GET_CACHE[cache_key] = (time.monotonic() + LATE_GET_CACHE_TTL, result)
+        else:
+            invalidate_late_cache(user_ctx.user.id, "posts")
+
+    return result
+
+
+async def _refresh_late_token(user_ctx: UserContext, stale_token: str) -> Optional[str]:
+    """
+    Get a fresh Late.dev access token after stale_token was rejected.
+    Only one refresh per user runs at a time; callers that waited on the
+    lock pick up the token the first one saved. Returns None if there is no
+    refresh token to use.
+    """
+    lock = _REFRESH_LOCKS.get(user_ctx.user.id)
+    if lock is None:
+        lock = _REFRESH_LOCKS[user_ctx.user.id] = asyncio.Lock()
+
+    async with lock:
+        # Another request may have refreshed while we waited
+        result = await user_ctx.db.execute(
+            select(User.late_oauth_token, User.late_refresh_token).where(User.id == user_ctx.user.id)
+        )
+        row = result.one_or_none()
+
+        if row and row.late_oauth_token and row.late_oauth_token != stale_token:
+            access_token, refresh_token = row.late_oauth_token, row.late_refresh_token
+        else:
+            refresh_token = (row.late_refresh_token if row else None) or user_ctx.late_refresh_token
+            if not refresh_token:
+                return None
+            tokens = await refresh_access_token(refresh_token)
+            access_token, refresh_token = tokens["access_token"], tokens["refresh_token"]
+            await save_tokens(
+                user_ctx.db,
+                user_ctx.user.buzzposter_api_key,
+                access_token,
+                refresh_token
             )
-            response.raise_for_status()
-            return response.json()
-
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                # Token expired, try to refresh
-                if user_ctx.late_refresh_token:
-                    from ..auth.late_oauth import refresh_access_token, save_tokens
-                    try:
-                        tokens = await refresh_access_token(user_ctx.late_refresh_token)
-                        await save_tokens(
-                            user_ctx.db,
-                            user_ctx.user.buzzposter_api_key,
-                            tokens["access_token"],
-                            tokens["refresh_token"]
-                        )
-                        # Retry request with new token
-                        response = await client.request(
-                            method,
-                            f"{LATE_API_BASE}/{endpoint}",
-                            headers={"Authorization": f"Bearer {tokens['access_token']}"},
-                            json=json_data,
-                            params=params,
-                        )
-                        response.raise_for_status()
-                        return response.json()
-                    except Exception:
-                        return {"error": "Token expired. Please reconnect via /auth/late/connect"}
-                return {"error": "Token expired. Please reconnect via /auth/late/connect"}
-            return {"error": f"Late.dev API error: {e.response.status_code} - {e.response.text}"}
-
-        except httpx.HTTPError as e:
-            return {"error": f"Late.dev request failed: {str(e)}"}
+
+        user_ctx.late_token = access_token
+        user_ctx.late_refresh_token = refresh_token
+        return access_token
+
+
+async def _send_late_request(
+    user_ctx: UserContext,
+    method: str,
+    endpoint: str,
+    json_data: Optional[Dict],
+    params: Optional[Dict]
+) -> Dict[str, Any]:
+    """Send a Late.dev request, refreshing the token once on a 401"""
+    client = get_http_client()
+    url = f"{LATE_API_BASE}/{endpoint}"
+
+    async def send(token: str) -> httpx.Response:
+        return await client.request(
+            method,
+            url,
+            headers={"Authorization": f"Bearer {token}"},
+            json=json_data,
+            params=params,
+        )
+
+    expired = {"error": "Token expired. Please reconnect via /auth/late/connect"}
+
+    try:
+        token = user_ctx.late_token
+        response = await send(token)
+
+        if response.status_code == 401:
+            # Token expired, refresh (or pick up a concurrent refresh) and retry
+            try:
+                token = await _refresh_late_token(user_ctx, token)
+            except Exception:
+                return expired
+            if not token:
+                return expired
+            response = await send(token)
+            if response.status_code == 401:
+                return expired
+
+        if not response.is_success:
+            return {"error": f"Late.dev API error: {response.status_code} - {response.text}"}
+        return orjson.loads(response.content)
+
+    except httpx.HTTPError as e:
+        return {"error": f"Late.dev request failed: {str(e)}"}
 
 
 async def buzzposter_list_social_accounts(user_ctx: UserContext) -> Dict[str, Any]:
@@ -137,7 +220,8 @@ async def buzzposter_cross_post(
     platforms: List[str],
     content: str,
     media_urls: Optional[List[str]] = None,
-    customize_per_platform: Optional[Dict[str, str]] = None
+    customize_per_platform: Optional[Dict[str, str]] = None,
+    parallel: bool = False
 ) -> Dict[str, Any]:
     """
     Post same content to multiple platforms
@@ -149,6 +233,8 @@ async def buzzposter_cross_post(
         content: Base text content to post
         media_urls: Optional list of media URLs to attach
         customize_per_platform: Optional dict of platform-specific content overrides
+        parallel: Post to each platform concurrently instead of via Late.dev's
+            cross-post endpoint
 
     Returns:
         Results for each platform
@@ -156,6 +242,31 @@ async def buzzposter_cross_post(
     await check_rate_limit(user_ctx, "buzzposter_cross_post")
     await check_feature_access(user_ctx, "social_posting")
 
+    if parallel:
+        # One POST /posts per platform, so latency is the slowest platform
+        # rather than the sum of all of them
+        overrides = customize_per_platform or {}
+        tasks = []
+        for platform in platforms:
+            platform_data = {
+                "platform": platform,
+                "content": overrides.get(platform, content),
+            }
+            if media_urls:
+                platform_data["media_urls"] = media_urls
+            tasks.append(_make_late_request(user_ctx, "POST", "posts", json_data=platform_data))
+
+        responses = await asyncio.gather(*tasks, return_exceptions=True)
+        results = {
+            platform: {"error": f"Late.dev request failed: {str(r)}"} if isinstance(r, Exception) else r
+            for platform, r in zip(platforms, responses)
+        }
+
+        if any("error" not in r for r in results.values()):
+            await log_usage(user_ctx, "buzzposter_cross_post")
+
+        return {"results": results}
+
     post_data = {
         "platforms": platforms,
         "content": content,